@@ -1,26 +1,123 @@
 import pandas as pd
+import numpy as np
 import folium
 from branca.colormap import LinearColormap
+from folium.plugins import FastMarkerCluster
 from streamlit_folium import st_folium
 import streamlit as st
-import altair as alt
 import os
 from datetime import timedelta, time as dt_time
 # ---------------------------
 # Load data + coordinates
 # ---------------------------
-@st.cache_data
+def read_with_parquet_cache(path, reader):
+    """Read `path` via `reader`, keeping a sidecar .parquet copy.
+
+    CSV/Excel parsing dominates cold-start time; the columnar copy loads in
+    tens of milliseconds on the next restart. The sidecar is rewritten
+    whenever the source file is newer than it.
+    """
+    parquet_path = path + ".parquet"
+    if os.path.exists(parquet_path) and \
+            os.path.getmtime(parquet_path) > os.path.getmtime(path):
+        return pd.read_parquet(parquet_path)
+    df = reader(path)
+    try:
+        df.to_parquet(parquet_path)
+    except Exception:
+        # No parquet engine, read-only dir, or un-serializable mixed-type
+        # column (e.g. the community Time column) — just skip the sidecar
+        if os.path.exists(parquet_path):
+            os.remove(parquet_path)
+    return df
+
+def clean_site(series):
+    """Normalize site names into a join key (whitespace, quotes, case)."""
+    return (
+        series.astype(str)
+        .str.strip()
+        .str.replace('\xa0', ' ', regex=False)
+        .str.replace('’', "'", regex=False)
+        .str.replace('‘', "'", regex=False)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.lower()
+    )
+
+# The only government-CSV columns the dashboard ever touches; everything
+# else (OBJECTID, Monitoring_program, Test_Name, ...) is dropped at parse
+# time so the cached frame and parquet sidecar stay narrow.
+USED_COLS = [
+    'Site_Description',
+    'Date_Sample_Collected',
+    'Result_Name',
+    'Result_Value_String',
+    'Result_Value_Numeric',
+    'Units',
+]
+
+def parse_algal_csv(path):
+    """Raw government CSV parse, dates included.
+
+    Parsing dates here (rather than after the cache) means the parquet
+    sidecar stores datetime64 directly, so warm starts skip the string
+    -> datetime conversion entirely.
+    """
+    df = pd.read_csv(
+        path, encoding="utf-8-sig",
+        usecols=lambda c: c.strip() in USED_COLS,
+    )
+    df.columns = df.columns.str.strip()
+    df['Date_Sample_Collected'] = pd.to_datetime(
+        df['Date_Sample_Collected'], errors='coerce'
+    )
+    # Sort here so the parquet sidecar is written with date-ordered row
+    # groups (prunable by date predicates) and the loader's sort is a no-op
+    return df.sort_values('Date_Sample_Collected').reset_index(drop=True)
+
+def build_popup_html(frame):
+    """Pre-render the marker popup HTML for every row of `frame`.
+
+    One vectorized string concat at load time replaces per-row f-string
+    assembly inside the marker loop. Community frames carry a Time column,
+    which gets its own popup line.
+    """
+    vals = pd.to_numeric(frame['Result_Value_Numeric'], errors='coerce')
+    value_display = vals.map(lambda v: '0' if pd.isna(v) else f'{v:,.0f}')
+    # Units is normalized (filled + categorical) by the loaders; the
+    # fallback only serves ad-hoc frames that never went through them
+    if 'Units' in frame.columns:
+        units = frame['Units'].fillna('cells/L').astype(str)
+    else:
+        units = 'cells/L'
+    if 'Time' in frame.columns:
+        time_part = frame['Time'].map(
+            lambda t: f"Time: {format_sample_time(t)}<br>" if pd.notna(t) else ''
+        )
+    else:
+        time_part = ''
+    return (
+        '<b>' + frame['Site_Description'].astype(str) + '</b><br>'
+        + frame['Date_Sample_Collected'].dt.strftime('%Y-%m-%d').fillna('NaT') + '<br>'
+        + time_part
+        + frame['Result_Name'].astype(str) + '<br>'
+        + value_display + ' ' + units
+    )
+
+@st.cache_data(persist="disk", ttl=3600, max_entries=1, show_spinner="Loading HAB data...")
 def load_data(algal_file="HarmfulAlgalBloom_MonitoringSites_-3886754981793402050.csv",
               site_file="HarmfulAlgalBloom_MonitoringSites_-5884474934260118018.csv"):
     # -----------------------
     # Load algal results
     # -----------------------
-    df = pd.read_csv(algal_file, encoding="utf-8-sig")
+    df = read_with_parquet_cache(algal_file, parse_algal_csv)
     df.columns = df.columns.str.strip()
-    df['Date_Sample_Collected'] = pd.to_datetime(
-        df['Date_Sample_Collected'], errors='coerce'
-    )
-   
+    # No-op on the hot path: parse_algal_csv / the parquet sidecar already
+    # deliver datetime64, so only guard against a stray string column
+    if not pd.api.types.is_datetime64_any_dtype(df['Date_Sample_Collected']):
+        df['Date_Sample_Collected'] = pd.to_datetime(
+            df['Date_Sample_Collected'], errors='coerce'
+        )
+
     # -----------------------
     # Clean Result_Name (minimal fix + standardization)
     # -----------------------
@@ -71,40 +168,30 @@ def load_data(algal_file="HarmfulAlgalBloom_MonitoringSites_-3886754981793402050
     df.loc[not_detected_mask, 'Result_Value_String'] = '0'
    
     # -----------------------
-    # Load site metadata
+    # Site coordinates: prefer the pre-baked dict module (regenerate with
+    # generate_site_coords.py when the site CSV changes); two .map calls
+    # replace the CSV parse + hash join. Fall back to merging the CSV.
     # -----------------------
-    sites = pd.read_csv(site_file, encoding="utf-8-sig")
-    sites.columns = sites.columns.str.strip()
-    sites = sites.rename(columns={"SiteName": "Site_Description"})
-   
-    # -----------------------
-    # Cleaning function for sites
-    # -----------------------
-    def clean_site(series):
-        return (
-            series.astype(str)
-            .str.strip()
-            .str.replace('\xa0', ' ', regex=False)
-            .str.replace('’', "'", regex=False)
-            .str.replace('‘', "'", regex=False)
-            .str.replace(r'\s+', ' ', regex=True)
-            .str.lower()
-        )
-   
     df["site_key"] = clean_site(df["Site_Description"])
-    sites["site_key"] = clean_site(sites["Site_Description"])
-   
-    # Keep only needed site columns
-    sites = (
-        sites[["site_key", "Latitude", "Longitude"]]
-        .dropna(subset=["Latitude", "Longitude"])
-        .drop_duplicates(subset=["site_key"])
-    )
-   
-    # -----------------------
-    # Merge
-    # -----------------------
-    df = df.merge(sites, on="site_key", how="left")
+    try:
+        from site_coords import COORD_LAT, COORD_LON
+        df["Latitude"] = df["site_key"].map(COORD_LAT)
+        df["Longitude"] = df["site_key"].map(COORD_LON)
+    except ImportError:
+        sites = read_with_parquet_cache(
+            site_file, lambda p: pd.read_csv(p, encoding="utf-8-sig")
+        )
+        sites.columns = sites.columns.str.strip()
+        sites = sites.rename(columns={"SiteName": "Site_Description"})
+        sites["site_key"] = clean_site(sites["Site_Description"])
+
+        # Keep only needed site columns
+        sites = (
+            sites[["site_key", "Latitude", "Longitude"]]
+            .dropna(subset=["Latitude", "Longitude"])
+            .drop_duplicates(subset=["site_key"])
+        )
+        df = df.merge(sites, on="site_key", how="left")
    
     # ────────────────────────────────────────────────
     # Apply small lat offset to Bottom samples (≈220 m)
@@ -119,17 +206,60 @@ def load_data(algal_file="HarmfulAlgalBloom_MonitoringSites_-3886754981793402050
     df.loc[bottom_mask, "Latitude"]  += OFFSET_LAT
     df.loc[bottom_mask, "Longitude"] += OFFSET_LON
 
-    return df
+    # ────────────────────────────────────────────────
+    # Pre-index for fast filtering on every rerun
+    # ────────────────────────────────────────────────
+    # Sorted dates let the date-range filter become a searchsorted slice,
+    # and categorical species names make isin() compare integer codes
+    # instead of strings.
+    # parse_algal_csv already delivers date order; only re-sort if needed
+    if not df['Date_Sample_Collected'].is_monotonic_increasing:
+        df = df.sort_values('Date_Sample_Collected')
+    df = df.reset_index(drop=True)
+    df['Result_Name'] = df['Result_Name'].astype('category')
+    df['Site_Description'] = df['Site_Description'].astype('category')
+    # Normalize Units once so nothing downstream needs a per-row default
+    if 'Units' not in df.columns:
+        df['Units'] = 'cells/L'
+    else:
+        df['Units'] = df['Units'].fillna('cells/L').astype('category')
+    # Coordinates only need map-display precision: float32 (~1 m) halves
+    # the bytes every filter pass touches. Counts stay float64 — the file
+    # holds values up to 1.6e10, past float32's exact-integer range, and
+    # popups print them digit-for-digit.
+    df['Latitude'] = df['Latitude'].astype(np.float32)
+    df['Longitude'] = df['Longitude'].astype(np.float32)
+    df['Result_Value_Numeric'] = pd.to_numeric(df['Result_Value_Numeric'], downcast='float')
+    # Pre-render popup HTML once, at load time
+    df['_popup'] = build_popup_html(df)
+
+    # Working columns (cleaning input, join key) are dead weight once the
+    # popup and coordinates exist — drop them so the cached frame stays lean
+    return df.drop(columns=['Result_Value_String', 'site_key'])
    
-@st.cache_data
-@st.cache_data
+def read_community_xlsx(path):
+    """Parse the community workbook, fastest available engine first.
+
+    calamine (python-calamine, optional) parses XLSX in Rust without
+    per-cell Python objects — roughly 2x faster than openpyxl here. Fall
+    back to openpyxl in read_only mode, which at least streams rows
+    without materializing styles/formulas.
+    """
+    try:
+        return pd.read_excel(path, sheet_name=0, engine='calamine')
+    except ImportError:
+        return pd.read_excel(
+            path, sheet_name=0, engine='openpyxl', engine_kwargs={'read_only': True}
+        )
+
+@st.cache_data(persist="disk", ttl=3600, max_entries=1, show_spinner="Loading community data...")
 def load_community(file_path="MASTER spreadsheet of community summaries.xlsx"):
     if not os.path.exists(file_path):
         st.warning(f"⚠️ Community data file '{file_path}' not found. Using empty dataset.")
         return pd.DataFrame()
- 
-    # Read Excel file
-    df = pd.read_excel(file_path, sheet_name=0)
+
+    # Read Excel file (slowest parse of the lot — keep a parquet sidecar).
+    df = read_with_parquet_cache(file_path, read_community_xlsx)
  
     # Trim whitespace from column names
     df.columns = df.columns.str.strip()
@@ -171,7 +301,11 @@ def load_community(file_path="MASTER spreadsheet of community summaries.xlsx"):
     # Drop original columns
     melted_df = melted_df.drop(['Location', 'Date'], axis=1)
  
-    # Convert cells/mL → cells/L
+    # Convert cells/mL → cells/L (coerce first — the sheet has occasional
+    # non-numeric cells, which string-repeat under *= 1000 otherwise)
+    melted_df['Result_Value_Numeric'] = pd.to_numeric(
+        melted_df['Result_Value_Numeric'], errors='coerce'
+    )
     melted_df['Result_Value_Numeric'] *= 1000
  
     # Add units
@@ -210,148 +344,566 @@ def load_community(file_path="MASTER spreadsheet of community summaries.xlsx"):
     # Convert coordinates to numeric
     melted_df['Latitude'] = pd.to_numeric(melted_df['Latitude'], errors='coerce')
     melted_df['Longitude'] = pd.to_numeric(melted_df['Longitude'], errors='coerce')
- 
-    return melted_df
+
+    # Same pre-indexing as load_data: sorted dates + categorical species
+    melted_df = melted_df.sort_values('Date_Sample_Collected').reset_index(drop=True)
+    melted_df['Result_Name'] = melted_df['Result_Name'].astype('category')
+    melted_df['Site_Description'] = melted_df['Site_Description'].astype('category')
+    melted_df['Units'] = melted_df['Units'].astype('category')
+    melted_df['Latitude'] = melted_df['Latitude'].astype(np.float32)
+    melted_df['Longitude'] = melted_df['Longitude'].astype(np.float32)
+    melted_df['Result_Value_Numeric'] = pd.to_numeric(
+        melted_df['Result_Value_Numeric'], downcast='float'
+    )
+    melted_df['_popup'] = build_popup_html(melted_df)
+
+    # Time only feeds the popup line; once that is rendered the mixed-type
+    # object column is dead weight in the cached frame
+    return melted_df.drop(columns=['Time'], errors='ignore')
+@st.cache_data
+def species_options(include_community):
+    """Sorted species list straight from the categorical dictionaries.
+
+    O(#species) against the load-time category codes instead of an O(N)
+    dropna().unique() pass over a freshly concatenated frame per rerun.
+    Loads the frames internally (like data_bounds) so callers never pull
+    a full DataFrame out of st.cache_data just to read its categories.
+    """
+    df = load_data()
+    species = set(df['Result_Name'].cat.categories) if not df.empty else set()
+    if include_community:
+        community_df = load_community()
+        if not community_df.empty:
+            species |= set(community_df['Result_Name'].cat.categories)
+    return sorted(species)
+@st.cache_data
+def data_bounds(include_community):
+    """Min/max collection dates across the active datasets.
+
+    Cached per dataset combination so the O(N) min/max scan (and the frame
+    concat it used to ride on) doesn't rerun on every widget interaction.
+    """
+    frames = [load_data()]
+    if include_community:
+        community = load_community()
+        if not community.empty:
+            frames.append(community)
+    mins = [f['Date_Sample_Collected'].min() for f in frames if not f.empty]
+    maxs = [f['Date_Sample_Collected'].max() for f in frames if not f.empty]
+    mins = [m for m in mins if pd.notna(m)]
+    maxs = [m for m in maxs if pd.notna(m)]
+    if not mins:
+        return pd.to_datetime('2020-01-01'), pd.to_datetime('2030-12-31')
+    return min(mins), max(maxs)
+
+@st.cache_data
+def site_options(include_community):
+    """Sorted site list from the categorical dictionaries, cached."""
+    sites = set(load_data()['Site_Description'].cat.categories)
+    if include_community:
+        community = load_community()
+        if not community.empty:
+            sites |= set(community['Site_Description'].cat.categories)
+    return sorted(sites)
 # ---------------------------
-# Build Streamlit app
+# Filtering
 # ---------------------------
-def main():
-    st.set_page_config(
-        page_title="Harmful Algal Bloom Monitoring - South Australia",
-        layout="wide",
-        initial_sidebar_state="expanded"
+def filter_by_date_and_species(frame, species_selected, start_date, end_date):
+    """Filter `frame` to the selected species and date window.
+
+    Relies on the loaders sorting by Date_Sample_Collected: the date range
+    becomes an O(log N) searchsorted slice, and the species isin() runs on
+    the (categorical) codes of the slice only — no full-frame scan per rerun.
+    """
+    if frame.empty:
+        return frame.copy()
+    dates = frame['Date_Sample_Collected']
+    lo = dates.searchsorted(start_date)
+    hi = dates.searchsorted(end_date, side='right')
+    window = frame.iloc[lo:hi]
+    return window[window['Result_Name'].isin(species_selected)].copy()
+
+def viewport_tuple(bounds):
+    """Flatten st_folium's bounds dict to (south, west, north, east).
+
+    Returns None when bounds are missing/malformed (first render, or the
+    component hasn't reported yet). The flat tuple is hashable, so it can
+    key the marker-data cache.
+    """
+    try:
+        return (bounds['_southWest']['lat'], bounds['_southWest']['lng'],
+                bounds['_northEast']['lat'], bounds['_northEast']['lng'])
+    except (KeyError, TypeError):
+        return None
+
+def filter_to_bounds(frame, viewport):
+    """Keep only rows inside `viewport` (south, west, north, east).
+
+    Users zoomed into one gulf shouldn't pay the marker cost of the whole
+    state. Returns `frame` unchanged when viewport is None.
+    """
+    if viewport is None or frame.empty:
+        return frame
+    south, west, north, east = viewport
+    return frame[
+        frame['Latitude'].between(south, north) &
+        frame['Longitude'].between(west, east)
+    ]
+
+# Beyond this many visible points, thin markers to one per grid cell
+DECIMATION_THRESHOLD = 2000
+GRID_DECIMALS = 2 # ≈1 km cells at SA latitudes
+
+def decimate_spatially(frame, threshold=DECIMATION_THRESHOLD):
+    """Thin oversized marker sets to the max-valued sample per grid cell.
+
+    Wide date ranges can put tens of thousands of points on the map; one
+    marker per ~1 km cell keeps hotspots visible (max, not mean, per cell)
+    while the emitted count stays roughly bounded by the cell count.
+    """
+    if len(frame) <= threshold:
+        return frame
+    g = frame.assign(
+        _lat=frame['Latitude'].round(GRID_DECIMALS),
+        _lon=frame['Longitude'].round(GRID_DECIMALS),
     )
-    # ---------------------------
-    # Custom CSS
-    # ---------------------------
-    st.markdown("""
-    <style>
-    .block-container {padding-top: 1rem; padding-bottom: 0.25rem;}
-    footer {visibility: hidden;}
-  
-    /* Sidebar styling */
-    section[data-testid="stSidebar"] {
-        font-size: 11px;
-        padding: 0.4rem 0.5rem 0.5rem 0.5rem;
-        max-width: 350px;
+    return (
+        g.sort_values('Result_Value_Numeric', ascending=False)
+        .drop_duplicates(['_lat', '_lon'])
+        .drop(columns=['_lat', '_lon'])
+    )
+# ---------------------------
+# Marker construction
+# ---------------------------
+# Color scale — static, so built once at import. Hex stops match the CSS
+# colorbar gradient and its transition points (0%, 20%, 40%, 60%, 100%).
+VIRIDIS_COLORS = ['#641478', '#89CFF0', '#21908c', '#5dc863', '#fde725']
+COLORMAP = LinearColormap(
+    colors=VIRIDIS_COLORS,
+    index=[0, 100000, 200000, 300000, 500000],
+    vmin=0,
+    vmax=500000
+)
+## COLORMAP = LinearColormap(colors=['green', 'yellow', 'red'], vmin=0, vmax=500000) ##old traffic light colormap
+
+# Above this many points, per-marker folium objects (one Jinja render each)
+# make the Python-side map build the bottleneck — switch to FastMarkerCluster,
+# which emits one JS array literal and builds markers browser-side.
+MARKER_CLUSTER_THRESHOLD = 5000
+
+# Browser-side marker factory for FastMarkerCluster: row = [lat, lon, color, popup]
+FAST_MARKER_CALLBACK = """
+function (row) {
+    var c = row[2];
+    return L.circleMarker([row[0], row[1]],
+        {radius: 6, color: c, fillColor: c, fillOpacity: 0.8}
+    ).bindPopup(row[3]);
+}
+"""
+
+def format_sample_time(t):
+    # Excel stores time as a fraction of a day; fall back to raw value
+    try:
+        fractional_day = float(t)
+        total_minutes = int(fractional_day * 1440)
+        return f"{total_minutes // 60:02d}:{total_minutes % 60:02d}"
+    except (TypeError, ValueError):
+        return str(t)
+
+def vectorized_colormap(colormap, values):
+    """Hex colors for a whole float array in one NumPy pass.
+
+    branca's LinearColormap.__call__ interpolates scalars one at a time in
+    pure Python; this replicates it (same stops, same rounding, same
+    '#rrggbbaa' output) with one np.interp per channel. NaN values map to
+    0, as the per-row marker code did before.
+    """
+    index = np.asarray(colormap.index, dtype=float)
+    channels = np.asarray(colormap.colors, dtype=float) # stops x RGBA floats
+    vals = np.nan_to_num(np.asarray(values, dtype=float), nan=0.0)
+    rgba = np.column_stack([
+        (np.interp(vals, index, channels[:, c]) * 255.9999).astype(int)
+        for c in range(4)
+    ])
+    return ["#%02x%02x%02x%02x" % tuple(row) for row in rgba]
+
+def build_marker_data(frame, colormap):
+    """Return a list of [lat, lon, color, popup_html] rows for `frame`.
+
+    Works on raw NumPy column arrays rather than .iterrows() — per-row
+    Series materialization dominated marker construction time on large
+    filtered sets. Rows without coordinates are dropped in one mask pass.
+    """
+    if frame.empty:
+        return []
+    # Round to 6 decimals (~0.1 m): keeps the float32 columns from
+    # serializing as 17-digit floats in the map HTML
+    lats = frame['Latitude'].to_numpy(dtype=float).round(6)
+    lons = frame['Longitude'].to_numpy(dtype=float).round(6)
+    # Coerce — the community sheet occasionally has non-numeric cells here
+    vals = pd.to_numeric(frame['Result_Value_Numeric'], errors='coerce').to_numpy(dtype=float)
+    # Popups are pre-rendered at load time; fall back for ad-hoc frames
+    if '_popup' in frame.columns:
+        popups = frame['_popup'].to_numpy()
+    else:
+        popups = build_popup_html(frame).to_numpy()
+
+    # Drop rows without coordinates once, up front
+    valid = ~np.isnan(lats) & ~np.isnan(lons)
+
+    colors = vectorized_colormap(colormap, vals)
+    return [[lats[i], lons[i], colors[i], popups[i]]
+            for i in np.flatnonzero(valid)]
+
+def add_geojson_markers(m, data):
+    """Add prepared [lat, lon, color, popup] rows as one GeoJson layer.
+
+    A single Jinja-rendered layer replaces one CircleMarker child per
+    point: folium templating cost becomes O(1) and the popup HTML rides
+    along as a feature property instead of N inline popup blobs.
+    """
+    if not data:
+        return
+    features = [
+        {'type': 'Feature',
+         'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+         'properties': {'color': color, 'popup': popup}}
+        for lat, lon, color, popup in data
+    ]
+    folium.GeoJson(
+        {'type': 'FeatureCollection', 'features': features},
+        marker=folium.CircleMarker(radius=6, fill=True, fill_opacity=0.8),
+        style_function=lambda f: {'color': f['properties']['color'],
+                                  'fillColor': f['properties']['color']},
+        popup=folium.GeoJsonPopup(fields=['popup'], labels=False),
+    ).add_to(m)
+
+def add_fast_markers(m, data):
+    """Add prepared marker rows as one FastMarkerCluster layer.
+
+    A single JS data array replaces N Jinja-rendered marker elements, so
+    Python build time and HTML size stay near-constant as the filtered
+    set grows. Clustering turns itself off at street zoom so individual
+    samples are still inspectable.
+    """
+    if not data:
+        return
+    FastMarkerCluster(
+        data=data,
+        callback=FAST_MARKER_CALLBACK,
+        options={"disableClusteringAtZoom": 10}
+    ).add_to(m)
+
+@st.cache_data
+def species_row_index(source):
+    """Row positions per species name, precomputed once per dataset.
+
+    Lets species selections turn into integer .take calls instead of a
+    boolean isin scan over the whole frame on every trend-cache miss.
+    """
+    frame = load_data() if source == 'government' else load_community()
+    if frame.empty:
+        return {}
+    codes = frame['Result_Name'].cat.codes.to_numpy()
+    return {
+        name: np.flatnonzero(codes == code)
+        for code, name in enumerate(frame['Result_Name'].cat.categories)
     }
+
+@st.cache_data(max_entries=32)
+def compute_trend(include_community, species_tuple, site):
+    """Long-form (date, species, mean cell count) series for the trend chart.
+
+    A direct groupby produces the long form Altair wants, skipping the old
+    pivot_table + melt round-trip, and the cache means sidebar interactions
+    that don't touch the trend controls reuse the result. Also returns the
+    underlying sample count for the caption.
+    """
+    sources = ('government', 'community') if include_community else ('government',)
+    parts = []
+    for source in sources:
+        frame = load_data() if source == 'government' else load_community()
+        if frame.empty:
+            continue
+        index = species_row_index(source)
+        rows = [index[s] for s in species_tuple if s in index]
+        if rows:
+            parts.append(frame.take(np.concatenate(rows)))
+    if not parts:
+        return pd.DataFrame(
+            columns=['Date_Sample_Collected', 'Species', 'Cell_Count']
+        ), 0
+    base = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+    plot_df = base[base['Result_Value_Numeric'].notna()]
+    if site != "All Sites":
+        plot_df = plot_df[plot_df['Site_Description'] == site]
+    if plot_df.empty:
+        return pd.DataFrame(
+            columns=['Date_Sample_Collected', 'Species', 'Cell_Count']
+        ), 0
+    # Bucket daily, dropping to weekly means for multi-year spans — the
+    # chart is ~800 px wide, so finer-than-weekly points on long spans are
+    # pure Vega payload with no visual difference
+    span = plot_df['Date_Sample_Collected'].max() - plot_df['Date_Sample_Collected'].min()
+    freq = 'D' if span.days < 365 else 'W'
+    trend = (
+        plot_df.groupby(
+            [pd.Grouper(key='Date_Sample_Collected', freq=freq), 'Result_Name'],
+            observed=True
+        )['Result_Value_Numeric'].mean().dropna().reset_index()
+    )
+    trend.columns = ['Date_Sample_Collected', 'Species', 'Cell_Count']
+    return trend, len(plot_df)
+
+# Pre-compiled Vega-Lite spec for the trend chart (the output of the old
+# alt.Chart(...).interactive().to_dict(), frozen). Only the data varies
+# between renders, so handing the spec straight to st.vega_lite_chart
+# skips Altair's per-render schema validation and chart compilation.
+TREND_SPEC = {
+    'mark': {'type': 'line', 'point': True},
+    'encoding': {
+        'x': {
+            'field': 'Date_Sample_Collected',
+            'type': 'temporal',
+            'title': 'Date',
+            'axis': {'labelAngle': 0, 'format': '%d %b %Y'}, # e.g. 15 Jan 2026
+        },
+        'y': {'field': 'Cell_Count', 'type': 'quantitative',
+              'title': 'Cell Count per L'},
+        'color': {'field': 'Species', 'type': 'nominal', 'title': 'Species'},
+        'tooltip': [
+            {'field': 'Date_Sample_Collected', 'type': 'temporal'},
+            {'field': 'Species', 'type': 'nominal'},
+            {'field': 'Cell_Count', 'type': 'quantitative'},
+        ],
+    },
+    'width': 800,
+    'height': 400,
+    'title': {
+        'text': ("Trends for selected species (note: average values will be "
+                 "displayed if 'All Sites' selected, *denotes community data)"),
+        'fontSize': 14,
+        'fontWeight': 'normal',
+        'color': '#4c4c4c', # dark grey
+    },
+    # Equivalent of .interactive(): bind an interval selection to the
+    # scales so zoom/pan keep working
+    'params': [{'name': 'zoom_pan',
+                'select': {'type': 'interval', 'encodings': ['x', 'y']},
+                'bind': 'scales'}],
+}
+
+@st.cache_data(max_entries=32, ttl=600)
+def get_marker_data(source, species_tuple, start_iso, end_iso, viewport, _colormap):
+    """Prepared marker rows for one data source under a given filter state.
+
+    Returns (marker_rows, n_filtered, n_visible): n_filtered is the row
+    count matching species + date range, n_visible the count inside the
+    viewport before decimation. The cache is keyed by the hashable filter
+    inputs, so reruns that only touch unrelated widgets (or bounce between
+    recent filter states) skip the filtering, color and popup work
+    entirely. _colormap is effectively constant and excluded from the key.
+    """
+    frame = load_data() if source == 'government' else load_community()
+    sub = filter_by_date_and_species(
+        frame, list(species_tuple), pd.Timestamp(start_iso), pd.Timestamp(end_iso)
+    )
+    visible = filter_to_bounds(sub, viewport)
+    n_visible = len(visible)
+    visible = decimate_spatially(visible)
+    return build_marker_data(visible, _colormap), len(sub), n_visible
+PAGE_CSS = """
+<style>
+.block-container {padding-top: 1rem; padding-bottom: 0.25rem;}
+footer {visibility: hidden;}
   
-    section[data-testid="stSidebar"] .stMarkdown p {margin-bottom: 0.25rem;}
-    .sidebar-card {
-        border: none; /* Remove border for subtlety */
-        border-radius: 0; /* Flatten it */
-        padding: 4px 0; /* Reduce vertical padding */
-        background: transparent; /* No background to blend in */
-        margin-bottom: 0.25rem; /* Tighten spacing */
-        font-size: 14px; /* Slightly smaller */
-        font-weight: normal; /* Not bold */
-        color: #666; /* Medium grey for low emphasis */
-        font-style: italic; /* Optional: subtle italic tilt */
-        text-decoration: underline; /* Adds underline */
-    }
-    /* Add margin-top to push the checkbox down closer to the species select */
-    section[data-testid="stSidebar"] [data-testid="stCheckbox"] {
-        margin-top: 10px !important; /* Adjust this value (e.g., 10px-20px) for desired spacing */
-    }
-    /* Reduce space before the species multiselect (pull it up closer to checkbox) */
-    section[data-testid="stSidebar"] [data-testid="stMultiSelect"] {
-        margin-top: -8px !important; /* Negative value pulls it up; adjust -5px to -12px as needed */
-    }
+/* Sidebar styling */
+section[data-testid="stSidebar"] {
+    font-size: 11px;
+    padding: 0.4rem 0.5rem 0.5rem 0.5rem;
+    max-width: 350px;
+}
   
-    /* Sidebar section filter header labels */
-    section[data-testid="stSidebar"] label {
-        font-weight: bold !important;
-        color: #000 !important;
-    }
+section[data-testid="stSidebar"] .stMarkdown p {margin-bottom: 0.25rem;}
+.sidebar-card {
+    border: none; /* Remove border for subtlety */
+    border-radius: 0; /* Flatten it */
+    padding: 4px 0; /* Reduce vertical padding */
+    background: transparent; /* No background to blend in */
+    margin-bottom: 0.25rem; /* Tighten spacing */
+    font-size: 14px; /* Slightly smaller */
+    font-weight: normal; /* Not bold */
+    color: #666; /* Medium grey for low emphasis */
+    font-style: italic; /* Optional: subtle italic tilt */
+    text-decoration: underline; /* Adds underline */
+}
+/* Add margin-top to push the checkbox down closer to the species select */
+section[data-testid="stSidebar"] [data-testid="stCheckbox"] {
+    margin-top: 10px !important; /* Adjust this value (e.g., 10px-20px) for desired spacing */
+}
+/* Reduce space before the species multiselect (pull it up closer to checkbox) */
+section[data-testid="stSidebar"] [data-testid="stMultiSelect"] {
+    margin-top: -8px !important; /* Negative value pulls it up; adjust -5px to -12px as needed */
+}
   
-    /* Smaller font for selected chips in sidebar multiselect */
-    section[data-testid="stSidebar"] span[data-baseweb="tag"] {
-        font-size: 14px !important; /* Adjust as needed for subtlety */
-    }
+/* Sidebar section filter header labels */
+section[data-testid="stSidebar"] label {
+    font-weight: bold !important;
+    color: #000 !important;
+}
   
-    /* Smaller font and padding for sidebar multiselect (species) */
-    section[data-testid="stSidebar"] [data-testid="stMultiSelect"] {
-        font-size: 12px !important;
-        padding: 0.2rem 0.3rem !important; /* Reduces internal padding; adjust values as needed */
-        margin: 0rem 0 0 !important; /* Optional: tightens outer margins for less vertical space */
-    }
+/* Smaller font for selected chips in sidebar multiselect */
+section[data-testid="stSidebar"] span[data-baseweb="tag"] {
+    font-size: 14px !important; /* Adjust as needed for subtlety */
+}
   
-    /* Smaller font and padding for sidebar date input (range) */
-    section[data-testid="stSidebar"] [data-testid="stDateInput"] {
-        font-size: 12px !important;
-        padding: 0.2rem 0.3rem !important; /* Reduces internal padding; tweak values for fit */
-        margin: 0rem 0 0 !important; /* Optional: tightens outer margins for less vertical space */
-    }
+/* Smaller font and padding for sidebar multiselect (species) */
+section[data-testid="stSidebar"] [data-testid="stMultiSelect"] {
+    font-size: 12px !important;
+    padding: 0.2rem 0.3rem !important; /* Reduces internal padding; adjust values as needed */
+    margin: 0rem 0 0 !important; /* Optional: tightens outer margins for less vertical space */
+}
   
-    /* Record counter*/
-    .records-count {
-        font-size: 14px !important;
-        color: #666; /* Optional: medium grey for subtlety, or keep #000 for black */
-        margin: 0.1rem 0 0;
-        padding-left: 4px; /* Indents text to right */
-    }
+/* Smaller font and padding for sidebar date input (range) */
+section[data-testid="stSidebar"] [data-testid="stDateInput"] {
+    font-size: 12px !important;
+    padding: 0.2rem 0.3rem !important; /* Reduces internal padding; tweak values for fit */
+    margin: 0rem 0 0 !important; /* Optional: tightens outer margins for less vertical space */
+}
   
-    /* Horizontal colorbar */
-    .colorbar-wrapper {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        margin-bottom: 2px;
-    }
-    .colorbar-container {
-        background: linear-gradient(to right,
-            #641478 0%, /* 0-100,000 */
-            #89CFF0 20%, /* 100,000-200,000 */
-            #21908c 40%, /* 200,000-300,000 */
-            #5dc863 60%, /* 300,000-400,000 */
-            #fde725 100% /* 400,000-500,000+ */
-        );
-        height: 20px;
-        border: 1px solid #ccc;
-        border-radius: 4px;
-        padding: 0;
-        max-width: 95%;
-        width: 100%;
-    }
+/* Record counter*/
+.records-count {
+    font-size: 14px !important;
+    color: #666; /* Optional: medium grey for subtlety, or keep #000 for black */
+    margin: 0.1rem 0 0;
+    padding-left: 4px; /* Indents text to right */
+}
   
-    .colorbar-labels {
-        display: flex;
-        justify-content: space-between;
-        width: 100%;
-        font-size: 11px; /* Smaller font to reduce cramping */
-        margin-top: 4px; /* Increased gap above labels */
-        color: #666;
-    }
+/* Horizontal colorbar */
+.colorbar-wrapper {
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+    margin-bottom: 2px;
+}
+.colorbar-container {
+    background: linear-gradient(to right,
+        #641478 0%, /* 0-100,000 */
+        #89CFF0 20%, /* 100,000-200,000 */
+        #21908c 40%, /* 200,000-300,000 */
+        #5dc863 60%, /* 300,000-400,000 */
+        #fde725 100% /* 400,000-500,000+ */
+    );
+    height: 20px;
+    border: 1px solid #ccc;
+    border-radius: 4px;
+    padding: 0;
+    max-width: 95%;
+    width: 100%;
+}
   
-    .colorbar-labels span {
-        flex: 1;
-        text-align: center;
-        color: #666;
-        font-weight: bold;
-        /* Removed text-shadow as it's less needed below the bar */
-    }
+.colorbar-labels {
+    display: flex;
+    justify-content: space-between;
+    width: 100%;
+    font-size: 11px; /* Smaller font to reduce cramping */
+    margin-top: 4px; /* Increased gap above labels */
+    color: #666;
+}
   
-    .colorbar-units {
-        font-size: 12px;
-        color: #666;
-        font-weight: bold;
-        margin-top: 4px;
-        margin-bottom: 4px; /* Added to match doubled top */
-        text-align: center;
-        white-space: nowrap;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    # ---------------------------
-    # File paths and data (load always, but filters conditional)
-    # ---------------------------
-    df = load_data(
-        "HarmfulAlgalBloom_MonitoringSites_-3886754981793402050.csv",
-        "HarmfulAlgalBloom_MonitoringSites_-5884474934260118018.csv"
+.colorbar-labels span {
+    flex: 1;
+    text-align: center;
+    color: #666;
+    font-weight: bold;
+    /* Removed text-shadow as it's less needed below the bar */
+}
+  
+.colorbar-units {
+    font-size: 12px;
+    color: #666;
+    font-weight: bold;
+    margin-top: 4px;
+    margin-bottom: 4px; /* Added to match doubled top */
+    text-align: center;
+    white-space: nowrap;
+}
+</style>
+"""
+
+@st.cache_resource
+def inject_page_css():
+    """Emit the static page <style> block once per session.
+
+    On cache hits Streamlit replays the recorded element instead of
+    re-parsing the 100-line markdown string on every rerun.
+    """
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+def build_base_map():
+    """Fresh base map: tiles, labels overlay and layer control.
+
+    Deliberately NOT cached — folium objects are mutated when markers are
+    added, so a st.cache_resource map would accumulate children across
+    reruns (and be shared between sessions). Building three jinja2
+    templates per rerun is noise next to the cached marker pipeline.
+    """
+    m = folium.Map(
+        location=[-34.9, 138.6],
+        zoom_start=6,
+        control_scale=True,
+        zoom_control='bottomleft', # Native positioning for zoom buttons
+        prefer_canvas=True # One shared canvas instead of an SVG node per marker
     )
-   
-    community_df = load_community()
+    folium.TileLayer(
+        tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+        attr='Esri', name='Satellite', overlay=False, control=True
+    ).add_to(m)
+    folium.TileLayer(
+        tiles="https://server.arcgisonline.com/ArcGIS/rest/services/Reference/World_Boundaries_and_Places/MapServer/tile/{z}/{y}/{x}",
+        attr='Esri', name='Labels', overlay=True, control=True
+    ).add_to(m)
+    folium.LayerControl(position='bottomright').add_to(m) # Native positioning for layers
+    return m
+
+# ---------------------------
+# Sidebar widgets
+# ---------------------------
+def render_sidebar_colorbar():
+    """Static HTML/CSS colorbar legend for the sidebar.
+
+    Kept Streamlit-side (styled by the main <style> block) rather than
+    letting branca inject its per-stop SVG legend onto the map.
+    """
+    st.markdown(
+        """
+        <div class="colorbar-wrapper">
+            <div class="colorbar-container"></div> <!-- Just the gradient, no labels inside -->
+            <div class="colorbar-labels">
+                <span>0</span><span>100,000</span><span>200,000</span><span>300,000</span><span>400,000</span><span>>500,000</span>
+            </div>
+        </div>
+        <div class="colorbar-units">Cell count per L</div>
+        """,
+        unsafe_allow_html=True
+    )
+# ---------------------------
+# Build Streamlit app
+# ---------------------------
+def main():
+    st.set_page_config(
+        page_title="Harmful Algal Bloom Monitoring - South Australia",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    inject_page_css()
+    # ---------------------------
+    # Data access: main() never holds the frames directly — every
+    # st.cache_data hit deep-copies its return value, so pulling the full
+    # DataFrame here would cost an O(N) copy per rerun. The cached helpers
+    # (data_bounds / species_options / get_marker_data / compute_trend)
+    # load inside their own cache scope and return only small results.
     # ---------------------------
     # PERSISTENT STATE FOR FILTERS (to avoid reset on toggle)
     # ---------------------------
@@ -371,18 +923,7 @@ def main():
         unsafe_allow_html=True
         )
         # Colorbar
-        st.markdown(
-        """
-        <div class="colorbar-wrapper">
-            <div class="colorbar-container"></div> <!-- Just the gradient, no labels inside -->
-            <div class="colorbar-labels">
-                <span>0</span><span>100,000</span><span>200,000</span><span>300,000</span><span>400,000</span><span>>500,000</span>
-            </div>
-        </div>
-        <div class="colorbar-units">Cell count per L</div>
-        """,
-        unsafe_allow_html=True
-        )
+        render_sidebar_colorbar()
         # Checkbox for including community data (placed here, above Filters)
         include_community = st.checkbox('Include community data', value=True)
         if 'prev_include_community' not in st.session_state:
@@ -394,21 +935,10 @@ def main():
         # Filters card (moved up to appear above Select species)
         st.markdown('<div class="sidebar-card">Filters</div>', unsafe_allow_html=True)
       
-        # Conditional combined data and date range
-        if include_community:
-            combined_df = pd.concat([df, community_df], ignore_index=True)
-            if not combined_df.empty:
-                min_date, max_date = combined_df['Date_Sample_Collected'].min(), combined_df['Date_Sample_Collected'].max()
-            else:
-                min_date, max_date = pd.to_datetime('2020-01-01'), pd.to_datetime('2030-12-31')
-        else:
-            combined_df = df.copy()
-            if not df.empty:
-                min_date, max_date = df['Date_Sample_Collected'].min(), df['Date_Sample_Collected'].max()
-            else:
-                min_date, max_date = pd.to_datetime('2020-01-01'), pd.to_datetime('2030-12-31')
-      
-        all_species = sorted(combined_df['Result_Name'].dropna().unique())
+        # Date bounds and species options come from cached helpers — no
+        # per-rerun concat of the two datasets
+        min_date, max_date = data_bounds(include_community)
+        all_species = species_options(include_community)
 
         # Initialize on first run or when species list changes significantly
         if "species_multiselect" not in st.session_state:
@@ -491,22 +1021,21 @@ def main():
     # ---------------------------
     # Filter dataset
     # ---------------------------
-    mask_main = (
-        df['Result_Name'].isin(species_selected) &
-        df['Date_Sample_Collected'].between(start_date, end_date)
-        # df['Result_Value_Numeric'].notna()
+    # Marker preparation is cached per filter state (species, dates,
+    # viewport); reruns from unrelated widget changes reuse the cache
+    viewport = viewport_tuple((st.session_state.get('hab_map') or {}).get('bounds'))
+    species_key = tuple(sorted(species_selected))
+    gov_rows, gov_count, gov_visible = get_marker_data(
+        'government', species_key, str(start_date), str(end_date), viewport, COLORMAP
     )
-    sub_df = df[mask_main].copy() # .copy() for safety
-    comm_sub_df = pd.DataFrame()
     if include_community:
-        mask_comm = (
-            community_df['Result_Name'].isin(species_selected) &
-            community_df['Date_Sample_Collected'].between(start_date, end_date)
-            # community_df['Result_Value_Numeric'].notna()
+        comm_rows, comm_count, comm_visible = get_marker_data(
+            'community', species_key, str(start_date), str(end_date), viewport, COLORMAP
         )
-        comm_sub_df = community_df[mask_comm].copy()
+    else:
+        comm_rows, comm_count, comm_visible = [], 0, 0
     # FIXED: Record count—now "Showing X records matching selected species and date range"
-    filtered_records = len(sub_df) + len(comm_sub_df)
+    filtered_records = gov_count + comm_count
     st.sidebar.markdown(f'<div class="records-count">Showing {filtered_records} records matching selected species and date range</div>', unsafe_allow_html=True)
     # Disclaimer at sidebar bottom
     st.sidebar.markdown(
@@ -531,216 +1060,93 @@ def main():
     # ---------------------------
     # Map
     # ---------------------------
-    m = folium.Map(
-        location=[-34.9, 138.6],
-        zoom_start=6,
-        control_scale=True,
-        zoom_control='bottomleft' # Native positioning for zoom buttons
-    )
-    folium.TileLayer(
-        tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
-        attr='Esri', name='Satellite', overlay=False, control=True
-    ).add_to(m)
-    folium.TileLayer(
-        tiles="https://server.arcgisonline.com/ArcGIS/rest/services/Reference/World_Boundaries_and_Places/MapServer/tile/{z}/{y}/{x}",
-        attr='Esri', name='Labels', overlay=True, control=True
-    ).add_to(m)
-    folium.LayerControl(position='bottomright').add_to(m) # Native positioning for layers
-    # Color scale (updated to match CSS colors and transition points)
-    viridis_colors = ['#641478', '#89CFF0', '#21908c', '#5dc863', '#fde725']
-    colormap = LinearColormap(
-        colors=viridis_colors,
-        index=[0, 100000, 200000, 300000, 500000], # Matches CSS % stops (0%, 20%, 40%, 60%, 100%)
-        vmin=0,
-        vmax=500000
-    )
-   
-    ## colormap = LinearColormap(colors=['green', 'yellow', 'red'], vmin=0, vmax=500000) ##old traffic light colormap
+    m = build_base_map()
 
-    # Add markers for community data
-    for _, row in comm_sub_df.iterrows():
-        if pd.notna(row.get('Latitude')) and pd.notna(row.get('Longitude')):
-            value = row['Result_Value_Numeric']
-            
-            if pd.isna(value):
-                value_display = "0"
-            else:
-                value_display = f"{value:,.0f}"
-            
-            color = colormap(value if pd.notna(value) else 0)
-            units = row.get('Units', 'cells/L')
-            
-            time_str = ''
-            if 'Time' in row and pd.notna(row.get('Time')):
-                try:
-                    fractional_day = float(row['Time'])
-                    total_minutes = int(fractional_day * 1440)
-                    hours = total_minutes // 60
-                    minutes = total_minutes % 60
-                    time_str = f"Time: {hours:02d}:{minutes:02d}<br>"
-                except:
-                    time_str = f"Time: {row['Time']}<br>"
-            
-            folium.CircleMarker(
-                location=[row['Latitude'], row['Longitude']],
-                radius=6, color=color, fill=True, fill_color=color, fill_opacity=0.8,
-                popup=(f"<b>{row['Site_Description']}</b><br>"
-                       f"{row['Date_Sample_Collected'].date()}<br>"
-                       f"{time_str}"
-                       f"{row['Result_Name']}<br>"
-                       f"{value_display} {units}")
-            ).add_to(m)
-  
-    # Add markers for main government data
-    for _, row in sub_df.iterrows():
-        if pd.notna(row.get('Latitude')) and pd.notna(row.get('Longitude')):
-            value = row['Result_Value_Numeric']
-            
-            # Robust display handling
-            if pd.isna(value):
-                value_display = "0"
-            else:
-                value_display = f"{value:,.0f}"
-            
-            color = colormap(value if pd.notna(value) else 0)
-            units = row.get('Units', 'cells/L')
-            
-            time_str = ''
-            if 'Time' in row and pd.notna(row.get('Time')):
-                try:
-                    fractional_day = float(row['Time'])
-                    total_minutes = int(fractional_day * 1440)
-                    hours = total_minutes // 60
-                    minutes = total_minutes % 60
-                    time_str = f"Time: {hours:02d}:{minutes:02d}<br>"
-                except:
-                    time_str = f"Time: {row['Time']}<br>"
-            
-            folium.CircleMarker(
-                location=[row['Latitude'], row['Longitude']],
-                radius=6, color=color, fill=True, fill_color=color, fill_opacity=0.8,
-                popup=(f"<b>{row['Site_Description']}</b><br>"
-                       f"{row['Date_Sample_Collected'].date()}<br>"
-                       f"{time_str}"
-                       f"{row['Result_Name']}<br>"
-                       f"{value_display} {units}")
-            ).add_to(m)
-          
-    # Always fit bounds if data (like old code)
-    combined_sub = pd.concat([sub_df, comm_sub_df], ignore_index=True)
-    if not combined_sub.empty:
-        lat_min = combined_sub['Latitude'].min()
-        lon_min = combined_sub['Longitude'].min()
-        lat_max = combined_sub['Latitude'].max()
-        lon_max = combined_sub['Longitude'].max()
-        if pd.notna(lat_min) and pd.notna(lon_min) and pd.notna(lat_max) and pd.notna(lon_max):
-            m.fit_bounds([[lat_min, lon_min], [lat_max, lon_max]])
+    # Add markers — community data first, then main government data.
+    # Large filtered sets go through FastMarkerCluster to keep map build
+    # time and HTML size bounded. Counts for the decimation caption:
+    visible_before_decimation = gov_visible + comm_visible
+    visible_points = len(gov_rows) + len(comm_rows)
+    if visible_points > MARKER_CLUSTER_THRESHOLD:
+        add_fast_markers(m, comm_rows)
+        add_fast_markers(m, gov_rows)
+    else:
+        add_geojson_markers(m, comm_rows)
+        add_geojson_markers(m, gov_rows)
+
+    # Fit bounds on first render only — once the user has panned/zoomed,
+    # refitting to the culled subset would fight their viewport
+    if viewport is None and (gov_rows or comm_rows):
+        all_lats = [row[0] for row in gov_rows] + [row[0] for row in comm_rows]
+        all_lons = [row[1] for row in gov_rows] + [row[1] for row in comm_rows]
+        m.fit_bounds([[min(all_lats), min(all_lons)], [max(all_lats), max(all_lons)]])
     # ---------------------------
     # Map display (undocked)
     # ---------------------------
-    st_folium(m, width='100%', height=550)
+    st_folium(m, width='100%', height=550, returned_objects=['bounds'], key='hab_map')
+    if visible_points < visible_before_decimation:
+        st.caption(
+            f"Displaying {visible_points} of {visible_before_decimation} points "
+            "(spatially aggregated — highest cell count shown per ~1 km cell). "
+            "Zoom in or narrow the date range to see individual samples."
+        )
     # ---------------------------
-    # Trends Section
+    # Trends Section (lazy — chart work only runs once opened)
     # ---------------------------
-    if not df.empty: # Check full df for options, even if sub_df is filtered
-        st.subheader("Trends Over Time")
+    with st.expander("Trends Over Time", expanded=False):
+        if not all_species:
+            st.info("No data loaded. Check file paths in the code.")
+        # The expander body still executes on every rerun (Streamlit has no
+        # truly lazy layout), so a checkbox gives a real short-circuit
+        elif st.checkbox("Show trend charts", key="trends_open"):
       
-        # FIXED: Option to include community in trends
-        include_comm_in_trends = st.checkbox("Include community data in trends", value=include_community)
+            # FIXED: Option to include community in trends
+            include_comm_in_trends = st.checkbox("Include community data in trends", value=include_community)
       
-        # FIXED: First, build base data for trends (df or combined)
-        if include_comm_in_trends and include_community and not community_df.empty:
-            base_trends_df = pd.concat([df, community_df], ignore_index=True)
-        else:
-            base_trends_df = df.copy()
+            # Options come from cached helpers over the unfiltered datasets
+            comm_in_trends = include_comm_in_trends and include_community
+            all_species_trends = species_options(comm_in_trends)
+            # Use same custom ordering as main dropdown for consistency
+            subcount = [s for s in all_species_trends if "Karenia spp subcount *" in s]
+            karenia_sp = [s for s in all_species_trends if "Karenia sp." in s and "subcount" not in s]
+            other_karenia = [s for s in all_species_trends if "Karenia" in s and s not in subcount + karenia_sp]
+            remaining = [s for s in all_species_trends if "Karenia" not in s]
+            custom_trend_options = subcount + karenia_sp + other_karenia + sorted(remaining)
+            default_trend_species = [s for s in custom_trend_options if "Karenia" in s] or custom_trend_options[:3] # Fallback to first 3 if no Karenia
       
-        # FIXED: Now get all_species_trends and sites from base (unfiltered)
-        all_species_trends = sorted(base_trends_df['Result_Name'].dropna().unique())
-        # Use same custom ordering as main dropdown for consistency
-        subcount = [s for s in all_species_trends if "Karenia spp subcount *" in s]
-        karenia_sp = [s for s in all_species_trends if "Karenia sp." in s and "subcount" not in s]
-        other_karenia = [s for s in all_species_trends if "Karenia" in s and s not in subcount + karenia_sp]
-        remaining = [s for s in all_species_trends if "Karenia" not in s]
-        custom_trend_options = subcount + karenia_sp + other_karenia + sorted(remaining)
-        default_trend_species = [s for s in custom_trend_options if "Karenia" in s] or custom_trend_options[:3] # Fallback to first 3 if no Karenia
-      
-        # Multi-select for species (defaults to Karenia)—NOW BEFORE FILTERING
-        selected_trend_species = st.multiselect(
-            "Select species for trend chart",
-            options=custom_trend_options,
-            default=default_trend_species
-        )
-      
-        # Site filter: All or specific—from base
-        all_sites = sorted(base_trends_df['Site_Description'].dropna().unique())
-        selected_site = st.selectbox(
-            "Filter by site",
-            options=["All Sites"] + all_sites,
-            index=0
-        )
-      
-        # FIXED: Now filter plot_df using selected_trend_species
-        plot_df = base_trends_df[
-            (base_trends_df['Result_Name'].isin(selected_trend_species)) &
-            (base_trends_df['Result_Value_Numeric'].notna())
-        ].copy()
-      
-        if selected_site != "All Sites":
-            plot_df = plot_df[plot_df['Site_Description'] == selected_site]
+            # Multi-select for species (defaults to Karenia)—NOW BEFORE FILTERING
+            selected_trend_species = st.multiselect(
+                "Select species for trend chart",
+                options=custom_trend_options,
+                default=default_trend_species
+            )
       
-        # Sort by date (keep as datetime)
-        plot_df = plot_df.sort_values('Date_Sample_Collected')
+            # Site filter: All or specific—from base
+            all_sites = site_options(comm_in_trends)
+            selected_site = st.selectbox(
+                "Filter by site",
+                options=["All Sites"] + all_sites,
+                index=0
+            )
       
-        if not plot_df.empty:
-            # Pivot for multi-line chart
-            trend_df = plot_df.pivot_table(
-                index='Date_Sample_Collected',
-                columns='Result_Name',
-                values='Result_Value_Numeric',
-                aggfunc='mean' # Average if multiple samples per day/species
-            ).reset_index()
-          
-            # Melt without date conversion
-            trend_melted = trend_df.melt(
-                id_vars='Date_Sample_Collected',
-                var_name='Species',
-                value_name='Cell_Count',
-                ignore_index=False
+            # Cached long-form series (mean per day/species if multiple samples);
+            # dates stay datetime for Altair
+            trend_melted, trend_points = compute_trend(
+                comm_in_trends,
+                tuple(selected_trend_species),
+                selected_site
             )
-            # No .dt.date here—keep as datetime for Altair
-          
-            # Altair chart (linear scale only)
-            base = alt.Chart(trend_melted).mark_line(point=True).encode(
-                ## x=alt.X('Date_Sample_Collected:T', title='Date', axis=alt.Axis(labelAngle=0)),
-                x=alt.X(
-                    'Date_Sample_Collected:T',
-                    title='Date',
-                    axis=alt.Axis(
-                        labelAngle=0,
-                        format='%d %b %Y' # e.g. 15 Jan 2026
-                    )
-            ),
-                y=alt.Y('Cell_Count:Q', title='Cell Count per L'),
-                color=alt.Color('Species:N', title='Species'),
-                tooltip=['Date_Sample_Collected', 'Species', 'Cell_Count']
-            ).properties(
-                width=800,
-                height=400,
-                title=alt.TitleParams(
-                    text="Trends for selected species (note: average values will be displayed if 'All Sites' selected, *denotes community data)",
-                    fontSize=14,
-                    fontWeight='normal',
-                    color='#4c4c4c' # dark grey
-                )
-            ).interactive() # Enables zoom/pan
-            st.altair_chart(base, use_container_width=True)
+
+            if not trend_melted.empty:
+                # Pre-compiled Vega-Lite spec (TREND_SPEC): only the data
+                # changes per render, so Altair's schema validation and
+                # to_dict() compilation are skipped entirely
+                st.vega_lite_chart(trend_melted, TREND_SPEC, use_container_width=True)
           
-            # Show filtered row count for transparency
-            st.caption(f"Showing {len(plot_df)} data points across {len(selected_trend_species)} species and {'all sites' if selected_site == 'All Sites' else selected_site}.")
-        else:
-            st.info("No data available for the selected species and site. Adjust options above.")
-    else:
-        st.info("No data loaded. Check file paths in the code.")
+                # Show filtered row count for transparency
+                st.caption(f"Showing {trend_points} data points across {len(selected_trend_species)} species and {'all sites' if selected_site == 'All Sites' else selected_site}.")
+            else:
+                st.info("No data available for the selected species and site. Adjust options above.")
     # ---------------------------
     # New panel below trends: Display PNG image
     # ---------------------------
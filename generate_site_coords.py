@@ -0,0 +1,41 @@
+"""One-off generator: bake monitoring-site coordinates into site_coords.py.
+
+Re-run this whenever the site metadata CSV is updated. load_data() prefers
+the generated module (two dict .map lookups) over parsing the CSV and
+hash-joining it on every cache miss.
+
+Usage: python generate_site_coords.py
+"""
+import pandas as pd
+
+from algal_dashboard import clean_site
+
+SITE_FILE = "HarmfulAlgalBloom_MonitoringSites_-5884474934260118018.csv"
+OUTPUT_FILE = "site_coords.py"
+
+
+def main():
+    sites = pd.read_csv(SITE_FILE, encoding="utf-8-sig")
+    sites.columns = sites.columns.str.strip()
+    sites = sites.rename(columns={"SiteName": "Site_Description"})
+    sites["site_key"] = clean_site(sites["Site_Description"])
+    sites = (
+        sites[["site_key", "Latitude", "Longitude"]]
+        .dropna(subset=["Latitude", "Longitude"])
+        .drop_duplicates(subset=["site_key"])
+    )
+
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.write('"""Generated by generate_site_coords.py — do not edit by hand."""\n')
+        f.write("COORD_LAT = {\n")
+        for key, lat in zip(sites["site_key"], sites["Latitude"]):
+            f.write(f"    {key!r}: {lat!r},\n")
+        f.write("}\n\nCOORD_LON = {\n")
+        for key, lon in zip(sites["site_key"], sites["Longitude"]):
+            f.write(f"    {key!r}: {lon!r},\n")
+        f.write("}\n")
+    print(f"Wrote {len(sites)} sites to {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
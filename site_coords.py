@@ -0,0 +1,1672 @@
+"""Generated by generate_site_coords.py — do not edit by hand."""
+COORD_LAT = {
+    'largs bay jetty': -34.82386667,
+    'grange jetty': -34.90266667,
+    'glenelg jetty': -34.9805,
+    "o'sullivan beach boat ramp": -35.11966667,
+    'onkaparinga rowing club': -35.152,
+    'patawalonga king st bridge': -34.9715,
+    'port river dock one': -34.841,
+    'port river garden island boat ramp': -34.80466667,
+    'port river north haven boat ramp': -34.79466667,
+    'port river outer harbour boat ramp': -34.774,
+    'port river st kilda boat ramp': -34.74333333,
+    'west lakes inlet': -34.89383333,
+    'west lakes bartley tce footbridge': -34.881,
+    'west lakes lochside footbridge': -34.87533333,
+    'west lakes exit': -34.8525,
+    'west beach boat ramp': -34.95783333,
+    'sardi caisson intake': -34.95643574,
+    'mundoo barrage upstream': -35.541673,
+    'mundoo barrage downstream': -35.541668,
+    'parnka point boat ramp': -35.902023,
+    'stoney well': -35.974997,
+    'snipe point': -36.110445,
+    '1.8km west salt creek': -36.132537,
+    'mark point': -35.634235,
+    'long point': -35.695781,
+    'bonneys': -35.796612,
+    'villa de yumpa': -35.928158,
+    'nth jack point': -36.037024,
+    'salt creek outlet': -36.134558,
+    'noonameena': -35.758163,
+    'lake alexandrina at 7km se milang': -35.43727,
+    'lake alexandrina at milang jetty': -35.40595,
+    'murray mouth': -35.556691,
+    'tauwitchere barrage downstream': -35.590186,
+    'tauwitchere barrage upstream': -35.589763,
+    'sth policeman point': -36.085134,
+    'lake alexandrina at 4km west pomanda point': -35.42976,
+    'lake alexandrina at beacon 95': -35.51481,
+    'mcgrath flat adjacent rabbit island': -35.85268467,
+    'morella creek @ gauge': -36.12488564,
+    'port noarlunga': -35.14927412,
+    'wirrina breakwater': -35.49958681,
+    'rapid bay jetty': -35.52132562,
+    'whyalla marina': -33.04057135,
+    'black point': -32.99138572,
+    'gsv25_036': -34.53092293,
+    'gsv25_066': -34.63020837,
+    'gsv25_090': -34.67424998,
+    'gsv25_129': -34.74928951,
+    'gsv25_203': -34.88049361,
+    'gsv25_466': -35.2484789,
+    'gsv25_517': -35.35114035,
+    'gsv25_552': -35.45671744,
+    'gsv25_571': -35.50520925,
+    'spencer gulf site 1': -33.22442,
+    'spencer gulf site 2': -33.239247,
+    'spencer gulf site 3': -33.257524,
+    'spencer gulf site 4': -33.260413,
+    'spencer gulf site 5': -33.244989,
+    'spencer gulf site 6': -33.230874,
+    'ardrossan jetty': -34.42513435,
+    'marion bay jetty': -35.23796753,
+    'port victoria jetty': -34.49507446,
+    'point turton jetty': -34.93330647,
+    'wallaroo jetty': -33.92636007,
+    'port augusta wharf': -32.49073841,
+    'encounter bay boat ramp': -35.58528251,
+    'port elliot jetty': -35.53520013,
+    'american river (ar-3a)': -35.77803333,
+    'boston bay (bb-13a)': -34.65716667,
+    'bickers island (bi-3a)': -34.7509,
+    'coffin bay (cob-1)': -34.61835,
+    'coorong (cor-8a)': -35.7233,
+    'coobowie (cw-4a)': -35.05815,
+    'denial bay (db-10a)': -32.1271,
+    'haslam (ha-90a)': -32.53053333,
+    'kellidie bay east (kel-7a)': -34.60816667,
+    'lower eyre (le-1a)': -34.65773333,
+    'mount dutton bay (mdb-09a)': -34.57441667,
+    'proper bay (pb-6a)': -34.78833333,
+    'port douglas (pd-90a)': -34.54616667,
+    'port vincent (pv-5a)': -34.76426667,
+    'smoky bay (smb-10a)': -32.33841667,
+    'smoky bay – waterwitch (smb-13a)': -32.37596667,
+    'st peters island (sp-2a)': -32.21595,
+    'stansbury (st-5a)': -34.89845,
+    'streaky bay - blancheport (stb-11a)': -32.73713333,
+    'franklin harbour (swb-1)': -33.70248333,
+    'franklin harbour (swb-2)': -33.70796667,
+    'franklin harbour (swb-3)': -33.72748333,
+    'franklin harbour (swb-4)': -33.7473,
+    'franklin harbour (swb-9)': -33.7396,
+    'franklin harbour (swb-90a)': -33.75216667,
+    'venus bay (vb-1a)': -33.22236667,
+    'wardang island (wi-01a)': -34.50707911,
+    'western cove (wk-3a)': -35.72761667,
+    'streaky bay - hummocks (stb-12a)': -32.7184,
+    'streaky bay - eba island (stb-16a)': -32.64208333,
+    'whyalla wh-a surface': -33.27901,
+    'whyalla wh-b surface': -33.11425,
+    'whyalla wh-c surface': -33.06566,
+    'whyalla wh-d surface': -33.02539,
+    'whyalla wh-e surface': -32.9967,
+    'tumby bay jetty': -34.37745919,
+    'whyalla jetty': -33.0430623,
+    'arno bay jetty': -33.91850647,
+    'point lowly marina': -32.99264147,
+    'kingscote jetty': -35.65579751,
+    'emu bay jetty': -35.59091602,
+    'brighton jetty': -35.01748807,
+    'myponga': -35.37055,
+    'hallett cove': -35.073528,
+    'aldinga snapper point': -35.269067,
+    'aldinga beach': -35.263435,
+    'munyaroo md1': -33.43658333,
+    'munyaroo md2': -33.37246667,
+    'munyaroo md3': -33.31946667,
+    'munyaroo md4': -33.40051667,
+    'munyaroo md5': -33.33025,
+    'munyaroo md6': -33.23376667,
+    'munyaroo md7': -33.4726,
+    'munyaroo md8': -33.49923333,
+    'penneshaw breakwater': -35.71659788,
+    'port macdonnell jetty': -38.05665173,
+    'cable bay': -35.28627,
+    'henley beach jetty 300 m offshore': -34.920092,
+    'henley beach jetty 500 m offshore': -34.920228,
+    'henley beach jetty surf zone': -34.91956,
+    'henley beach jetty 1 nm offshore': -34.92068,
+    'marino 1': -35.04461,
+    'marino 2': -35.0452,
+    'marino 3': -35.0439,
+    'port lincoln salmon pty ltd': -35.00861,
+    'robe breakwater': -37.15932824,
+    'cape jaffa jetty': -36.93968694,
+    'seacliff 1': -35.0342,
+    'seacliff 2': -35.03648,
+    'seacliff 3': -35.03337,
+    'henley beach 1': -34.91439,
+    'henley beach 2': -34.91371,
+    'henley beach 3': -34.91559,
+    'parham 1': -34.43724,
+    'parham 2': -34.43104,
+    'parham 3': -34.43378,
+    'port noarlunga 1': -35.152999,
+    'port noarlunga 2': -35.154041,
+    'port noarlunga 3': -35.152205,
+    'west beach 1': -34.9421,
+    'west beach 2': -34.94112,
+    'west beach 3': -34.94279,
+    'port river 1': -34.84211,
+    'port river 2': -34.84345,
+    'port river 3': -34.84525,
+    'stansbury ad hoc': -34.92895,
+    'aldinga fishkill 3': -35.31512,
+    'aldinga fishkill 1': -35.31607,
+    'aldinga fishkill 2': -35.31695,
+    'largs fishkill 1': -34.82079,
+    'largs fishkill 2': -34.82004,
+    'largs fishkill 3': -34.82156,
+    'robe long beach boatswains point': -37.163,
+    'robe long beach middle': -37.157,
+    'robe long beach south town end': -37.165,
+    'pt. clinton 1': -34.229,
+    'pt. clinton 2': -34.22914,
+    'pt. clinton 3': -34.2299,
+    'coorong (cor-4a)': -35.612,
+    'coorong (cor-12a)': -35.8354,
+    'moana 1 fish kill': -35.20121,
+    'moana 2 fish kill': -35.20215,
+    'moana 3 fish kill': -35.20061,
+    'north brighton 1 fish kill': -35.03103,
+    'north brighton 2 fish kill': -35.02991,
+    'north brighton 3 fish kill': -35.03196,
+    'coorong (cor-2a)': -35.58039054,
+    'vivonne bay': -35.99569941,
+    'coorong (cor-1m)': -35.55664412,
+    'port clinton fishkill 1': -34.2287,
+    'port clinton fishkill 2': -34.26103,
+    'port clinton fishkill 3': -34.2275,
+    'christies beach fishkill 1': -35.1317,
+    'christies beach fishkill 2': -35.1333,
+    'christies beach fishkill 3': -35.136,
+    'tailem bend fishkill 2': -35.2569,
+    'tailem bend fishkill 3': -35.2581,
+    'coorong (cor-2m)': -35.5825,
+    'coorong (cor-14a)': -35.910349,
+    'henley beach jetty': -34.9198,
+    'washpool rd fishkill 1': -35.2949,
+    'washpool rd fishkill 2': -35.29609,
+    'washpool rd fishkill 3': -35.29702,
+    'hab 01 surface': -33.6,
+    'hab 02 surface': -33.72501553,
+    'hab 03 surface': -33.84983168,
+    'hab 04 surface': -33.97444711,
+    'hab 05 surface': -34.09886048,
+    'hab 06 surface': -34.22307045,
+    'hab 07 surface': -34.34707568,
+    'hab 08 surface': -34.47087486,
+    'hab 09 surface': -33.77390225,
+    'hab 10 surface': -33.94775676,
+    'hab 11 surface': -34.12156176,
+    'hab 12 surface': -34.29531547,
+    'hab 13 surface': -34.46901609,
+    'hab 14 surface': -34.64266186,
+    'hab 15 surface': -34.81625097,
+    'hab 16 surface': -34.4594474,
+    'hab 17 surface': -34.66,
+    'hab 18 surface': -34.83212659,
+    'hab 19 surface': -35.00418943,
+    'hab 20 surface': -35.17618675,
+    'hab 21 surface': -35.34811678,
+    'hab 22 surface': -35.51997774,
+    'hab 23 surface': -34.66,
+    'hab 24 surface': -34.83693429,
+    'hab 25 surface': -35.01382193,
+    'hab 26 surface': -35.19066111,
+    'hab 27 surface': -35.36745,
+    'hab 28 surface': -35.54418679,
+    'hab 29 surface': -34.75,
+    'hab 30 surface': -34.92888853,
+    'hab 31 surface': -35.10773664,
+    'hab 32 surface': -35.28654251,
+    'hab 33 surface': -35.46530429,
+    'hab 34 surface': -35.72053375,
+    'hab 35 surface': -35.69048623,
+    'hab 36 surface': -35.66007894,
+    'hab 37 surface': -35.62931222,
+    'coobowie (cw-3)': -35.06240001,
+    'coobowie (cw-4)': -35.05616662,
+    'coobowie (cw-6)': -35.05211667,
+    'coobowie (cw-6a)': -35.04908332,
+    'stansbury (st-3)': -34.9056,
+    'stansbury (st-4)': -34.90071666,
+    'stansbury (st-8)': -34.89161667,
+    'stansbury (st-9)': -34.90085,
+    'port vincent (pv-2)': -34.77191667,
+    'port vincent (pv-4)': -34.77041667,
+    'port vincent (pv-3)': -34.76908333,
+    'carrickalinga 1': -35.4250461,
+    'carrickalinga 2': -35.4260632,
+    'carrickalinga 3': -35.4267391,
+    'coorong (cor-10a)': -35.7806,
+    'goolwa recreational beach (1)': -35.54078,
+    'goolwa recreational beach (2)': -35.52872,
+    'goolwa recreational beach (3)': -35.51693,
+    'coorong (cor-13a)': -35.8713,
+    'serenity campsite s1': -33.79951667,
+    'serenity campsite s3': -33.79876667,
+    'serenity campsite s5': -33.79801667,
+    'serenity campsite s2': -33.79951667,
+    'serenity campsite s4': -33.79876667,
+    'serenity campsite s6': -33.79801667,
+    'hallet cove fishkill 1': -35.08411,
+    'hallet cove fishkill 2': -35.0826,
+    'hallet cove fishkill 3': -35.0809,
+    'seacliff fishkill 1': -35.0293,
+    'seacliff fishkill 2': -35.02978,
+    'seacliff fishkill 3': -35.0291,
+    'henley beach fishkill 1': -34.93145,
+    'henley beach fishkill 2': -34.93232,
+    'henley beach fishkill 3': -34.93079,
+    'glenelg fishkill 1': -34.97882,
+    'glenelg fishkill 2': -34.98035,
+    'glenelg fishkill 3': -34.98157,
+    'hab 01 bottom': -33.6,
+    'hab 02 bottom': -33.72501553,
+    'hab 03 bottom': -33.84983168,
+    'hab 04 bottom': -33.97444711,
+    'hab 05 bottom': -34.09886048,
+    'hab 06 bottom': -34.22307045,
+    'hab 07 bottom': -34.34707568,
+    'hab 08 bottom': -34.47087486,
+    'hab 09 bottom': -33.77390225,
+    'hab 10 bottom': -33.94775676,
+    'hab 11 bottom': -34.12156176,
+    'hab 12 bottom': -34.29531547,
+    'hab 13 bottom': -34.46901609,
+    'hab 14 bottom': -34.64266186,
+    'hab 15 bottom': -34.81625097,
+    'hab 16 bottom': -34.4594474,
+    'hab 17 bottom': -34.66,
+    'hab 18 bottom': -34.83212659,
+    'hab 19 bottom': -35.00418943,
+    'hab 20 bottom': -35.17618675,
+    'hab 21 bottom': -35.34811678,
+    'hab 22 bottom': -35.51997774,
+    'hab 23 bottom': -34.66,
+    'hab 24 bottom': -34.83693429,
+    'hab 25 bottom': -35.01382193,
+    'hab 26 bottom': -35.19066111,
+    'hab 27 bottom': -35.36745,
+    'hab 28 bottom': -35.54418679,
+    'hab 29 bottom': -34.75,
+    'hab 30 bottom': -34.92888853,
+    'hab 31 bottom': -35.10773664,
+    'hab 32 bottom': -35.28654251,
+    'hab 33 bottom': -35.46530429,
+    'hab 34 bottom': -35.72053375,
+    'hab 35 bottom': -35.69048623,
+    'hab 36 bottom': -35.66007894,
+    'hab 37 bottom': -35.62931222,
+    'klein point fishkill 1': -34.95984,
+    'klein point fishkill 2': -34.95943,
+    'klein point fishkill 3': -34.95881,
+    'port clinton fishkill 1 (oct)': -34.22393,
+    'port clinton fishkill 2 (oct)': -34.22486,
+    'port clinton fishkill 3 (oct)': -34.22645,
+    'ardrossan fishkill 1': -34.43547,
+    'ardrossan fishkill 2': -34.43505,
+    'ardrossan fishkill 3': -34.4347,
+    'second valley fishkill 1': -35.5114,
+    'second valley fishkill 2': -35.5105,
+    'second valley fishkill 3': -35.51133333,
+    'port noarlunga fishkill 1': -35.16558333,
+    'port noarlunga fishkill 2': -35.1664,
+    'port noarlunga fishkill 3': -35.16494667,
+    'myponga beach fishkill 1': -35.37113333,
+    'myponga beach fishkill 2': -35.371,
+    'myponga beach fishkill 3': -35.37148333,
+    'morgans beach fishkill 1': -35.59454,
+    'morgans beach fishkill 2': -35.59402,
+    'morgans beach fishkill 3': -35.59518,
+    'fishery beach fishkill 1': -35.63272,
+    'fishery beach fishkill 2': -35.63299,
+    'fishery beach fishkill 3': -35.63342,
+    'moana fishkill 1': -35.20304,
+    'moana fishkill 2': -35.20366,
+    'moana fishkill 3': -35.20267,
+    'marion bay fishkill 1 (nov)': -35.24376667,
+    'marion bay fishkill 2 (nov)': -35.24376927,
+    'marion bay fishkill 3 (nov)': -35.2437655,
+    'aldinga beach fishkill 1 (nov)': -35.287625,
+    'aldinga beach fishkill 2 (nov)': -35.286695,
+    'aldinga beach fishkill 3 (nov)': -35.28894,
+    'henley beach fishkill 1 (nov)': -34.93238333,
+    'henley beach fishkill 2 (nov)': -34.93171667,
+    'henley beach fishkill 3 (nov)': -34.93075,
+    'christies beach fishkill 1 (nov)': -35.13506,
+    'christies beach fishkill 2 (nov)': -35.13574,
+    'christies beach fishkill 3 (nov)': -35.13408,
+    'fishery beach fishkill 1 (nov)': -35.63264,
+    'fishery beach fishkill 2 (nov)': -35.63281,
+    'fishery beach fishkill 3 (nov)': -35.63271,
+    'hallett cove fishkill 1 (nov)': -35.07863,
+    'hallett cove fishkill 2 (nov)': -35.07788,
+    'hallett cove fishkill 3 (nov)': -35.07688,
+    'marino fishkill 1 (nov)': -35.04466,
+    'marino fishkill 2 (nov)': -35.04414,
+    'marino fishkill 3 (nov)': -35.04495,
+    'somerton fishkill 1 (nov)': -34.9993,
+    'somerton fishkill 2 (nov)': -34.99876,
+    'somerton fishkill 3 (nov)': -35.0009,
+    'semaphore fishkill 1 (nov)': -34.84041,
+    'semaphore fishkill 2 (nov)': -34.83935,
+    'semaphore fishkill 3 (nov)': -34.8413,
+    'coorong (cor-6a)': -35.6669,
+    'point lowly lighthouse': -33.00091759,
+    'victor fishkill 1 (nov)': -35.53841,
+    'victor fishkill 2 (nov)': -35.53858,
+    'victor fishkill 3 (nov)': -35.53831,
+    'sultana point fishkill 1 (nov)': -35.11425,
+    'sultana point fishkill 3 (nov)': -35.11498483,
+    'foul bay fishkill 1 (nov)': -35.19295799,
+    'foul bay fishkill 2 (nov)': -35.19351667,
+    'foul bay fishkill 3 (nov)': -35.19413599,
+    'moorowie fishkill 1 (nov)': -35.11401818,
+    'moorowie fishkill 2 (nov)': -35.11378333,
+    'moorowie fishkill 3 (nov)': -35.11385908,
+    'whyalla beached stingray 1 (nov)': -33.0442,
+    'whyalla beached stingray 2 (nov)': -33.04448333,
+    'whyalla beached stingray 3 (nov)': -33.04396667,
+    'snapper point fishkill 1 (nov)': -34.77106667,
+    'snapper point fishkill 2 (nov)': -34.77198333,
+    'snapper point fishkill 3 (nov)': -34.77013333,
+    'whyalla wh-a bottom': -33.27901,
+    'whyalla wh-b bottom': -33.11425,
+    'whyalla wh-c bottom': -33.06566,
+    'whyalla wh-d bottom': -33.02539,
+    'whyalla wh-e bottom': -32.9967,
+    'aldinga fishkill (nov)': -35.2901465,
+    'sellicks beach fishkill (nov)': -35.32923,
+    'silver sands fishkill (nov)': -35.30888,
+    'american river (ar-3)': -35.77266667,
+    'american river (ar-2)': -35.77816667,
+    'american river (ar-1)': -35.78269444,
+    'webb beach fishkill 1 (nov)': -34.4597129,
+    'webb beach fishkill 2 (nov)': -34.4602885,
+    'webb beach fishkill 3 (nov)': -34.4662268,
+    'tennyson fishkill 1 (nov)': -34.88545,
+    'tennyson fishkill 2 (nov)': -34.88621,
+    'tennyson fishkill 3 (nov)': -34.88469,
+    'tiddy widdy fishkill 1 (nov)': -34.40805869,
+    'tiddy widdy fishkill 2 (nov)': -34.4088,
+    'tiddy widdy fishkill 3 (nov)': -34.40936333,
+    'middleton point': -35.516147,
+    'parsons beach': -35.633918,
+    'waitpinga beach': -35.63607,
+    'christies beach fishkill 1 (nov ii)': -35.13061,
+    'christies beach fishkill 2 (nov ii)': -35.13309,
+    'christies beach fishkill 3 (nov ii)': -35.13603,
+    'semaphore fishkill (nov)': -34.8427,
+    'tennyson fishkill (nov)': -34.88386,
+    'grange fishkill (nov)': -34.89983,
+    'henley beach fishkill (nov)': -34.92391,
+    'glenelg fishkill (nov)': -34.97869,
+    'kingston park (nov)': -35.04061,
+    'somerton park beach (nov)': -34.99958,
+    'seaford fishkill 1 (dec)': -35.18113,
+    'seaford fishkill 2 (dec)': -35.18042,
+    'seaford fishkill 3 (dec)': -35.17969,
+    'port willunga fishkill 1 (dec)': -35.25816,
+    'port willunga fishkill 2 (dec)': -35.25712,
+    'port willunga fishkill 3 (dec)': -35.25564,
+    'brown bay (dec)': -38.041639,
+    'tennyson fishkill 1 (dec)': -34.8891,
+    'tennyson fishkill 2 (dec)': -34.88865,
+    'tennyson fishkill 3 (dec)': -34.89025,
+    'normanville fishkill 1 (dec)': -35.44521,
+    'normanville fishkill 2 (dec)': -35.44446,
+    'normanville fishkill 3 (dec)': -35.44563,
+    'silver sands fishkill 1 (dec)': -35.31184,
+    'silver sands fishkill 2 (dec)': -35.31049,
+    'silver sands fishkill 3 (dec)': -35.30844,
+    'hab 38 bottom': -35.11,
+    'hab 38 surface': -35.11,
+    'hab 39 bottom': -35.01811,
+    'hab 39 surface': -35.01811,
+    'hab 40 bottom': -34.92595,
+    'hab 40 surface': -34.92595,
+    'hab 41 bottom': -34.8335,
+    'hab 41 surface': -34.8335,
+    'hab 42 bottom': -34.74078,
+    'hab 42 surface': -34.74078,
+    'carrickalinga fishkill 1 (dec)': -35.42516409,
+    'carrickalinga fishkill 2 (dec)': -35.4254,
+    'carrickalinga fishkill 3 (dec)': -35.42638,
+    'normanville fishkill 1 (dec ii)': -35.4448,
+    'normanville fishkill 2 (dec ii)': -35.44528,
+    'normanville fishkill 3 (dec ii)': -35.44567,
+    'stony point': -32.99594,
+    'browns beach': -35.181327,
+    'little emu beach': -35.272766,
+    'shell beach': -35.191708,
+    'chinamans': -35.286212,
+    'west bay': -35.235513,
+    'west cape': -35.248911,
+    'deep pondalowie bay': -35.23925,
+    'susanne shoal': -35.2384833,
+    'pondalowie out front surface': -35.22635,
+    'pondalowie mooring surface': -35.2304833,
+    'smiths bay beach': -35.5962,
+    'stokes bay boat ramp': -35.625,
+    'moana - seaford beach': -35.184722,
+    'moana beach': -35.201944,
+    'sellicks silver sands beach': -35.304722,
+    'sellicks beach': -35.334167,
+    'browns surface': -35.174783,
+    'browns bottom': -35.174783,
+    'inner maquarie bottom': -35.2832166,
+    'inner maquarie surface': -35.2832166,
+    'lawrey bottom': -35.242616,
+    'lawrey surface': -35.242616,
+    'outer maquarie bottom': -35.320816,
+    'outer maquarie surface': -35.320816,
+    'pondalowie 1 bottom': -35.204716,
+    'pondalowie 1 surface': -35.204716,
+    'pondalowie beach': -35.23551,
+    'pondalowie mooring bottom': -35.2304833,
+    'pondalowie out front bottom': -35.22635,
+    'waller bottom': -35.209966,
+    'waller surface': -35.209966,
+    'north of thistle surface': -34.88795,
+    'north of thistle bottom': -34.88795,
+    'wedge island north': -35.13585,
+    'wedge island bay bottom': -35.14227,
+    'west of wedge island surface': -35.09964,
+    'west of wedge island bottom': -35.09964,
+    'hab 43 bottom': -35.20468333,
+    'hab 43 surface': -35.20468333,
+    'hab 46 bottom': -35.36976667,
+    'hab 46 surface': -35.36976667,
+    'hab 47 bottom': -35.13603333,
+    'hab 47 surface': -35.13603333,
+    'emmes bottom': -35.3065,
+    'emmes surface': -35.3065,
+    'neels bottom': -35.3239,
+    'neels surface': -35.3239,
+    'althorpe bottom': -35.377333,
+    'althorpe surface': -35.377333,
+    'outer suzzane bottom': -35.2788,
+    'outer suzzane surface': -35.2788,
+    'cape wiles bottom': -34.98059,
+    'cape wiles surface': -34.98059,
+    'williams island bottom': -35.01717,
+    'williams island surface': -35.01717,
+    'maclaren point bottom': -34.8036,
+    'maclaren point surface': -34.8036,
+    'boston aquawatch bottom': -34.71789,
+    'boston aquawatch surface': -34.71789,
+    'west cape offshore surface': -35.32404,
+    'west cape offshore bottom': -35.32404,
+    'daly head surface': -35.044683,
+    'daly head bottom': -35.044683,
+    'lake macquarie bank surface': -35.3125,
+    'lake macquarie bank bottom': -35.3125,
+    'hab 44 bottom': -35.309,
+    'hab 44 surface': -35.309,
+    'hab 45 bottom': -35.35551667,
+    'hab 45 surface': -35.35551667,
+    'site 1 (jan)': -35.15455,
+    'site 2 (jan)': -35.15381667,
+    'site 3 (jan)': -35.15528333,
+    'corny point': -34.89555,
+    'point souttar fishkill 2 (jan)': -34.92115167,
+    'point souttar fishkill 1 (jan)': -34.92115167,
+    'point souttar fishkill 3 (jan)': -34.92115167,
+    'hab 48 bottom': -34.711394,
+    'hab 48 surface': -34.711394,
+    'hab 49 bottom': -34.72448,
+    'hab 49 surface': -34.72448,
+    'hab 50 bottom': -34.867644,
+    'hab 50 surface': -34.867644,
+    'hab 51 bottom': -34.949839,
+    'hab 51 surface': -34.949839,
+    'hab 52 bottom': -35.026231,
+    'hab 52 surface': -35.026231,
+    'hab 53 bottom': -35.062982,
+    'hab 53 surface': -35.062982,
+    'hab 55 bottom': -34.9208,
+    'hab 55 surface': -34.9208,
+    'neptune 50 bottom': -35.33215,
+    'neptune 50 surface': -35.33215,
+    'neptune north bottom': -35.315183,
+    'neptune north surface': -35.315183,
+    'neptune bay bottom': -35.33135,
+    'neptune bay surface': -35.33135,
+    'corny point dairy rd': -34.91848135,
+    'hab 54 bottom': -34.55,
+    'hab 54 surface': -34.55,
+    'thistle ad hoc 1 bottom': -35.02392,
+    'thistle ad hoc 1 surface': -35.02392,
+    'thistle ad hoc 2 bottom': -35.06205,
+    'thistle ad hoc 2 surface': -35.06205,
+    'thistle ad hoc 3 bottom': -35.04227,
+    'thistle ad hoc 3 surface': -35.04227,
+    'thistle ad hoc 4 bottom': -34.98414,
+    'thistle ad hoc 4 surface': -34.98414,
+    'spilsby ad hoc 1 bottom': -34.67059,
+    'spilsby ad hoc 1 surface': -34.67059,
+    'spilsby ad hoc 2 bottom': -34.60393,
+    'spilsby ad hoc 2 surface': -34.60393,
+    'north neptune': -35.225,
+    'low rocks': -35.183333,
+    'tiperra lighthouse': -34.04545961,
+    'curta rocks bottom': -34.9257,
+    'curta rocks surface': -34.9257,
+    'fishery bay bottom': -34.938251,
+    'fishery bay surface': -34.938251,
+    'red banks bottom': -34.909758,
+    'red banks surface': -34.909758,
+    'almonta bottom': -34.705836,
+    'almonta surface': -34.705836,
+    'hummock bottom': -34.711451,
+    'hummock surface': -34.711451,
+    'reef point bottom': -34.482108,
+    'reef point surface': -34.482108,
+    'coffin bay 1 bottom': -34.457626,
+    'coffin bay 1 surface': -34.457626,
+    'coffin bay 2 bottom': -34.464704,
+    'coffin bay 2 surface': -34.464704,
+    'drummond bottom': -34.168068,
+    'drummond surface': -34.168068,
+    'point turton 1 bottom': -34.8673,
+    'point turton 1 surface': -34.8673,
+    'point turton 2 bottom': -34.692283,
+    'point turton 2 surface': -34.692283,
+    'dany beach': -34.913212,
+    'louth bay jetty': -34.540429,
+    'north shields jetty': -34.62911,
+    'port lincoln town jetty': -34.718097,
+    'point turton 3 bottom': -34.809635,
+    'point turton 3 surface': -34.809635,
+    'caso bottom': -35.79115,
+    'caso surface': -35.79115,
+    'west end bottom': -35.778583,
+    'west end surface': -35.778583,
+    'port rickaby': -34.672517,
+    'hardwicke bay': -34.88902925,
+    'kingston jetty': -36.82469538,
+    'kirton point jetty': -34.729571,
+    'shoal bay tunakill 1 (feb 2026)': -35.612787,
+    'point turton fishkill 2 (feb 2026)': -34.93383333,
+    'point turton fishkill 3 (feb 2026)': -34.9329353,
+    'point turton fishkill 1 (feb 2026)': -34.93473137,
+    'hardwicke bay fishkill 2 (feb 2026)': -34.9,
+    'hardwicke bay fishkill 3 (feb 2026)': -34.899102,
+    'hardwicke bay fishkill 1 (feb 2026)': -34.900898,
+    'kingston park fishkill 1 (feb 2026)': -35.03741667,
+    'kingston park fishkill 2 (feb 2026)': -35.03655556,
+    'kingston park fishkill 3 (feb 2026)': -35.03541667,
+    'long beach robe fishkill 1 (feb 2026)': -37.0785,
+    'long beach robe fishkill 3 (feb 2026)': -37.07760278,
+    'long beach robe fishkill 2 (feb 2026)': -37.07939722,
+    'port victoria fishkill 2 (feb 2026)': -34.49581667,
+    'port victoria fishkill 3 (feb 2026)': -34.49491867,
+    'port victoria fishkill 1 (feb 2026)': -34.49671944,
+    'port rickaby fishkill 2 (feb 2026)': -34.67143333,
+    'port rickaby fishkill 3 (feb 2026)': -34.67053333,
+    'port rickaby fishkill 1 (feb 2026)': -34.67233333,
+    'wardang island bottom': -34.558383,
+    'wardang island surface': -34.558383,
+    'wardang island 2 surface': -34.62286004,
+    'wardang island 2 bottom': -34.62286004,
+    'rocky island surface': -34.803333,
+    'williams island 2 surface': -35.003127,
+    'cape catastrophe surface': -34.98654976,
+    'geltwood beach': -37.61604585,
+    'southend jetty': -37.567321,
+    'posties beach': -38.050134,
+    'seven mile road coorong robs point fishkill 1 (feb 2026)': -35.79633029,
+    'seven mile road coorong robs point fishkill 2 (feb 2026)': -35.78930989,
+    'seven mile road coorong robs point fishkill 3 (feb 2026)': -35.78018876,
+    'river torrens fishkill 1 (feb 2026)': -34.89272531,
+    'river torrens fishkill 2 (feb 2026)': -34.89383386,
+    'river torrens fishkill 3 (feb 2026)': -34.89316873,
+    'wauraltee beach fishkill 1 (feb 2026)': -34.57539122,
+    'wauraltee beach fishkill 2 (feb 2026)': -34.57265619,
+    'wauraltee beach fishkill 3 (feb 2026)': -34.56837584,
+    'b1 deep chlorophyll max 39m': -35.94000004,
+    'c1 deep chlorophyll max 13m': -36.08,
+    'd1 deep chlorophyll max 12m': -36.10300002,
+    'ad7 deep chlorophyll max 15m': -36.71010208,
+    'e1 surface': -35.98099682,
+    'e3 surface': -36.10399059,
+    'c1 surface': -36.08,
+    'c3 surface': -36.2,
+    'seal bay': -35.99472001,
+    'moonta jetty': -34.053215,
+    'destrees bay': -35.93989988,
+    'hanson bay': -36.01705007,
+    'flour cask bay': -35.87845,
+    'encounter boat ramp': -35.585432,
+    'petrel cove beach': -35.592526,
+    'waitpinga beach carpark': -35.635074,
+    'parsons headland': -35.63356,
+    'west bay (ki)': -35.88714497,
+    'brown beach': -38.04101,
+    'weeroona island': -33.10306467,
+    'balgowan': -34.3089,
+    'hab 56 bottom': -35.7327,
+    'hab 56 surface': -35.7327,
+    'hab 57 bottom': -35.661,
+    'hab 57 surface': -35.661,
+    'proper bay (pb-5)': -34.7664,
+    'bickers island (bi-4)': -34.746467,
+    'boston bay (bb-14)': -34.677083,
+    'lower eyre (bb-15)': -34.679367,
+    'c1 bottom': -36.08,
+    'd1 surface': -36.10300002,
+    'd1 bottom': -36.10300002,
+    'e1 bottom': -35.98099682,
+    'locks well beach': -33.7430742,
+    'wedge island bay surface': -35.14227,
+    'minlacowie': -34.8052,
+    'wallaroo 1b fishkill (mar 2026)': -33.9238,
+    'wallaroo 2a fishkill (mar 2026)': -33.92681,
+    'wallaroo 3a fishkill (mar 2026)': -33.927608,
+    'barker knoll': -35.55865,
+    'mundoo boat ramp': -35.5423,
+    'port hughes jetty': -34.07475461,
+    'balgowan 2 bottom': -34.310567,
+    'balgowan 2 surface': -34.310567,
+    'wallaroo bottom': -33.88945,
+    'wallaroo surface': -33.88945,
+    'moonta bottom': -34.0427,
+    'moonta surface': -34.0427,
+    'edithburgh jetty': -35.083149,
+    'bickers island (bi-1a)': -34.74588333,
+    'kellidie bay west (kel-9)': -34.59211667,
+    'proper bay (pb-10a)': -34.76593333,
+    'western cove (wk-3)': -35.73668333,
+    'western cove (wk-5)': -35.69643333,
+    'western cove (wk-6)': -35.66976667,
+    'black point 1': -34.6129197999999,
+    'black point 2': -34.6131535,
+    'black point 3': -34.6128353,
+    'emu bay beach 1 (nov)': -35.592117,
+    'emu bay beach 2 (nov)': -35.591583,
+    'emu bay beach 3 (nov)': -35.5904669999999,
+    'tumby bay 1 fishkill (jul 2025)': -34.353983333,
+    'tumby bay 2 fishkill (jul 2025)': -34.3529166669999,
+    'tumby bay 3 fishkill (jul 2025)': -34.3520166669999,
+    'bluff beach 2 fishkill (jul 2025)': -34.7247316,
+    'bluff beach 3 fishkill (jul 2025)': -34.730566,
+    'west lakes 1 fishkill (oct 2025)': -34.8919299999999,
+    'west lakes 2 fishkill (oct 2025)': -34.8930386,
+    'west lakes 3 fishkill (oct 2025)': -34.8936482999999,
+    'christies beach 1 fishkill (oct 2025)': -35.137575,
+    'christies beach 2 fishkill (oct 2025)': -35.136658,
+    'christies beach 3 fishkill (oct 2025)': -35.1355829999999,
+    'west lakes shore 1 fishkill (oct 2025)': -34.8649621,
+    'west lakes shore 2 fishkill (oct 2025)': -34.8658068999999,
+    'west lakes shore 3 fishkill (oct 2025)': -34.8643001999999,
+    'browns beach 1 fishkill (dec 2025)': -35.793733,
+    'browns beach 2 fishkill (dec 2025)': -35.7941329999999,
+    'browns beach 3 fishkill (dec 2025)': -35.7947169999999,
+    'glenelg 1 fishkill (dec 2025)': -34.96655,
+    'west beach 2 fishkill (dec 2025)': -34.96471,
+    'west beach 3 fishkill (dec 2025)': -34.9592,
+    'west lakes 1 fishkill (nov 2025)': -34.8649399999999,
+    'west lakes 2 fishkill (nov 2025)': -34.864033935,
+    'west lakes 3 fishkill (nov 2025)': -34.865836799,
+    'boatswain point fishkill (mar 2025)': -37.071345376,
+    "hickey's point fishkill (apr 2025)": -35.0264318869999,
+    'coobowie inlet fishkill (apr 2025)': -35.054805229,
+    'coobowie bay fishkill (apr 2025)': -35.0522945189999,
+    'point moorowie fishkill (apr 2025)': -35.115740902,
+    'port vincent fishkill (apr 2025)': -34.7710440889999,
+    'stansbury fishkill (apr 2025)': -34.9074912209999,
+    'goolwa beach fishkill (apr 2025)': -35.526275965,
+    'edithburgh jetty fishkill (apr 2025)': -35.08479418,
+    'edithburgh windmill fishkill (apr 2025)': -35.1225381099999,
+    'coobowie fishkill (apr 2025)': -35.0506343819999,
+    'ki bale 1 fishkill (apr 2025)': -35.9971765499999,
+    'ki bale 2 fishkill (apr 2025)': -35.9971765,
+    'ki bale 3 fishkill (apr 2025)': -35.9971765,
+    'goolwa beach 2km from mouth fishkill (apr 2025)': -35.5733633579999,
+    'robe west beach fishkill (apr 2025)': -37.172826459,
+    'kingston fishkill (apr 2025)': -36.8268835219999,
+    'butlers beach fishkill (apr 2025)': -35.238074519,
+    'innes national park fishkill (apr 2025)': -35.2631571659999,
+    'marion bay fishkill (apr 2025)': -35.2426632359999,
+    'goolwa 1 fishkill (apr 2025)': -35.524642055,
+    'goolwa 2 fishkill (apr 2025)': -35.5246420999999,
+    'goolwa 3 fishkill (apr 2025)': -35.5246420999999,
+    'goolwa 4 fishkill (apr 2025)': -35.5246420999999,
+    'goolwa 5 fishkill (apr 2025)': -35.5246420999999,
+    'inside cape jaffa fishkill (may 2025)': -36.9321944279999,
+    'ki emu bay (middle bay) fishkill (may 2025)': -35.592729735,
+    'ki emu bay jetty fishkill (may 2025)': -35.590910435,
+    'ki emu bay vehicle entrance fishkill (may 2025)': -35.5937701829999,
+    'min oil beach 1 fishkill (may 2025)': -35.739647399,
+    'min oil beach 3 fishkill (may 2025)': -35.739653512,
+    'min oil beach 2 fishkill (may 2025)': -35.7396474,
+    'louth bay fishkill (may 2025)': -34.54681275,
+    'port vincent marina fishkill (may 2025)': -34.765969393,
+    'edithburgh jetty fishkill (may 2025)': -35.08479418,
+    'port broughton boat ramp fishkill (may 2025)': -33.59537203,
+    'germein fishkill (may 2025)': -33.022207189,
+    'germein bay fishkill (may 2025)': -33.023323225,
+    'port broughton fishkill (may 2025)': -33.5994833729999,
+    'goolwa beach site 1 fishkill (jun 2025)': -35.524642055,
+    'goolwa beach site 2 fishkill (jun 2025)': -35.5246420999999,
+    'nepean bay 1 fishkill (jun 2025)': -35.728090009,
+    'nepean bay 2 fishkill (jun 2025)': -35.72809,
+    'nepean bay 3 fishkill (jun 2025)': -35.72809,
+    'tennyson beach fishkill (jun 2025)': -34.880488823,
+    'ardrossan jetty 1 fishkill (jul 2025)': -34.439228026,
+    'ardrossan jetty 3 fishkill (jul 2025)': -34.44016765,
+    'ardrossan jetty 2 fishkill (jul 2025)': -34.43828095,
+    'louth bay 1 fishkill (feb 2026)': -34.54681275,
+    'louth bay 2 fishkill (feb 2026)': -34.5459,
+    'louth bay 3 fishkill (feb 2026)': -34.5477,
+    'south beach fishkill (mar 2025)': -35.641463696,
+    'south beach lagoon fishkill (mar 2025)': -35.638268,
+    'south creek fishkill (mar 2025)': -35.641042016,
+    'beach hut fishkill (apr 2025)': -34.895723754,
+    'klein hut fishkill (apr 2025)': -34.9186940339999,
+    'main site fishkill (may 2025)': -34.935651166,
+    'n 50m fishkill (may 2025)': -34.935185823,
+    'fishermans point (may 2025)': -33.55218982,
+    'hallys beach streaky bay fishkill 1 (apr 2026)': -32.75076,
+    'hallys beach streaky bay fishkill 2 (apr 2026)': -32.749858288,
+    'hallys beach streaky bay fishkill 3 (apr 2026)': -32.752563427,
+    'almonta beach': -34.6881333339999,
+    'moonlight east fishkill (apr 2026)': -34.507673601,
+    'moonlight centre fishkill (apr 2026)': -34.508288701,
+    'moonlight west fishkill (apr 2026)': -34.510808901,
+    'emu bay fishkill (apr 2026)': -35.595307001,
+    'barker reserve 1 fishkill (may 2026)': -35.55799,
+    'barker reserve 2 fishkill (may 2026)': -35.55778,
+    'barker reserve 3 fishkill (may 2026)': -35.55808,
+    'marion bay 1 fishkill (may 2026)': -35.23508821,
+    'marion bay 2 fishkill (may 2026)': -35.235856,
+    'marion bay 3 fishkill (may 2026)': -35.23671305,
+    'town jetty fishkill (may 2026)': -34.718852,
+    'main beach 1 fishkill (may 2026)': -34.721184,
+    'main beach 2 fishkill (may 2026)': -34.7212779,
+    'point boston 1 bottom': -34.657733,
+    'point boston 1 surface': -34.657733,
+    'point boston 2 bottom': -34.657167,
+    'point boston 2 surface': -34.657167,
+    'point boston 3 bottom': -34.672068,
+    'point boston 3 surface': -34.672068,
+    'north shields 1 fishkill (may 2026)': -34.62861,
+    'north shields 2 fishkill (may 2026)': -34.62861,
+    'north access 3 fishkill (may 2026)': -34.619635,
+    'north access 4 fishkill (may 2026)': -34.619635,
+    'north access 5 fishkill (may 2026)': -34.619615,
+    'north access 6 fishkill (may 2026)': -34.619615,
+    'boston bay mooring bottom': -34.72237,
+    'boston bay mooring surface': -34.72237,
+    'farm beach - fishwatch 1': -34.4958,
+    'farm beach - fishwatch 2': -34.4952,
+    'farm beach - fishwatch 3': -34.4962,
+    'port lincoln marina bridge': -34.7440653008839,
+    'port lincoln marina boat ramp': -34.7427333008839,
+    'peak bay 6 fishkill (june 2026)': -34.495111110881,
+    'peak bay 1 fishkill (june 2026)': -34.489972221881,
+    'peak bay 2 fishkill (june 2026)': -34.493611110881,
+    'peak bay 3 fishkill (june 2026)': -34.5069999998812,
+    'peak bay 4 fishkill (june 2026)': -34.5148611108813,
+    'peak bay 5 fishkill (june 2026)': -34.5171944448813,
+    'port neill jetty': -34.1156,
+    'tumby bay surface': -34.3776,
+    'tumby bay bottom': -34.3776,
+    'lipson cove bottom': -34.2799,
+    'lipson cove surface': -34.2799,
+    'glenelg 1 fishkill (jul 2026)': -34.9795600007107,
+    'glenelg 2 fishkill (jul 2026)': -34.9783700006834,
+    'glenelg 3 fishkill (jul 2026)': -34.977570001058,
+    'grange 1 fishkill (jul 2026)': -34.9124600005437,
+    'grange 2 fishkill (jul 2026)': -34.9115400009889,
+    'grange 3 fishkill (jul 2026)': -34.9108100012206,
+    'tunkalilla beach': -35.6405160010248,
+    'cape willoughby north': -35.8392830010485,
+    'cape willoughby south': -35.8453540008283,
+    'cape jervis jetty': -35.6063390011438,
+    'stansbury jetty': -34.90178904,
+    'wool bay jetty': -34.99452506,
+    'coobowie causeway': -35.05351339,
+    'elliston jetty': -33.6405,
+}
+
+COORD_LON = {
+    'largs bay jetty': 138.4827,
+    'grange jetty': 138.4857833,
+    'glenelg jetty': 138.5080333,
+    "o'sullivan beach boat ramp": 138.46725,
+    'onkaparinga rowing club': 138.4719833,
+    'patawalonga king st bridge': 138.5128333,
+    'port river dock one': 138.5074667,
+    'port river garden island boat ramp': 138.54025,
+    'port river north haven boat ramp': 138.4867667,
+    'port river outer harbour boat ramp': 138.4860833,
+    'port river st kilda boat ramp': 138.53585,
+    'west lakes inlet': 138.4899333,
+    'west lakes bartley tce footbridge': 138.48845,
+    'west lakes lochside footbridge': 138.4997333,
+    'west lakes exit': 138.4983833,
+    'west beach boat ramp': 138.5039667,
+    'sardi caisson intake': 138.49469724,
+    'mundoo barrage upstream': 138.905548,
+    'mundoo barrage downstream': 138.905273,
+    'parnka point boat ramp': 139.395848,
+    'stoney well': 139.503803,
+    'snipe point': 139.604581,
+    '1.8km west salt creek': 139.620593,
+    'mark point': 139.075728,
+    'long point': 139.161775,
+    'bonneys': 139.317545,
+    'villa de yumpa': 139.438969,
+    'nth jack point': 139.54967,
+    'salt creek outlet': 139.635705,
+    'noonameena': 139.261728,
+    'lake alexandrina at 7km se milang': 139.03982,
+    'lake alexandrina at milang jetty': 138.97741,
+    'murray mouth': 138.881804,
+    'tauwitchere barrage downstream': 139.015597,
+    'tauwitchere barrage upstream': 139.015651,
+    'sth policeman point': 139.583338,
+    'lake alexandrina at 4km west pomanda point': 139.26869,
+    'lake alexandrina at beacon 95': 139.06475,
+    'mcgrath flat adjacent rabbit island': 139.38696391,
+    'morella creek @ gauge': 139.65327384,
+    'port noarlunga': 138.46433864,
+    'wirrina breakwater': 138.23857904,
+    'rapid bay jetty': 138.18538594,
+    'whyalla marina': 137.59133297,
+    'black point': 137.72027746,
+    'gsv25_036': 138.04926601,
+    'gsv25_066': 138.11341024,
+    'gsv25_090': 138.35755727,
+    'gsv25_129': 138.36062638,
+    'gsv25_203': 138.12185027,
+    'gsv25_466': 138.44057647,
+    'gsv25_517': 138.35280017,
+    'gsv25_552': 138.14241325,
+    'gsv25_571': 138.20517638,
+    'spencer gulf site 1': 137.481947,
+    'spencer gulf site 2': 137.471722,
+    'spencer gulf site 3': 137.469654,
+    'spencer gulf site 4': 137.478715,
+    'spencer gulf site 5': 137.482709,
+    'spencer gulf site 6': 137.497223,
+    'ardrossan jetty': 137.92582193,
+    'marion bay jetty': 136.98445464,
+    'port victoria jetty': 137.4792946,
+    'point turton jetty': 137.35304854,
+    'wallaroo jetty': 137.61821009,
+    'port augusta wharf': 137.75869799,
+    'encounter bay boat ramp': 138.598833,
+    'port elliot jetty': 138.68442018,
+    'american river (ar-3a)': 137.79085,
+    'boston bay (bb-13a)': 135.8986,
+    'bickers island (bi-3a)': 135.9533167,
+    'coffin bay (cob-1)': 135.4743833,
+    'coorong (cor-8a)': 139.1699,
+    'coobowie (cw-4a)': 137.75245,
+    'denial bay (db-10a)': 133.5992333,
+    'haslam (ha-90a)': 134.1947667,
+    'kellidie bay east (kel-7a)': 135.4907167,
+    'lower eyre (le-1a)': 135.9499,
+    'mount dutton bay (mdb-09a)': 135.4367167,
+    'proper bay (pb-6a)': 135.88075,
+    'port douglas (pd-90a)': 135.3783833,
+    'port vincent (pv-5a)': 137.89155,
+    'smoky bay (smb-10a)': 133.8951667,
+    'smoky bay – waterwitch (smb-13a)': 133.8885167,
+    'st peters island (sp-2a)': 133.6883667,
+    'stansbury (st-5a)': 137.82555,
+    'streaky bay - blancheport (stb-11a)': 134.2298833,
+    'franklin harbour (swb-1)': 136.9359833,
+    'franklin harbour (swb-2)': 136.92615,
+    'franklin harbour (swb-3)': 136.90825,
+    'franklin harbour (swb-4)': 136.9141667,
+    'franklin harbour (swb-9)': 136.9021167,
+    'franklin harbour (swb-90a)': 136.9048833,
+    'venus bay (vb-1a)': 134.6725667,
+    'wardang island (wi-01a)': 137.4246654,
+    'western cove (wk-3a)': 137.65728333,
+    'streaky bay - hummocks (stb-12a)': 134.20141667,
+    'streaky bay - eba island (stb-16a)': 134.24031667,
+    'whyalla wh-a surface': 137.46897,
+    'whyalla wh-b surface': 137.54828,
+    'whyalla wh-c surface': 137.62698,
+    'whyalla wh-d surface': 137.696,
+    'whyalla wh-e surface': 137.74773,
+    'tumby bay jetty': 136.10705408,
+    'whyalla jetty': 137.59372698,
+    'arno bay jetty': 136.57627252,
+    'point lowly marina': 137.78327571,
+    'kingscote jetty': 137.64655721,
+    'emu bay jetty': 137.5067461,
+    'brighton jetty': 138.5120937,
+    'myponga': 138.384517,
+    'hallett cove': 138.494139,
+    'aldinga snapper point': 138.433117,
+    'aldinga beach': 138.456019,
+    'munyaroo md1': 137.39168333,
+    'munyaroo md2': 137.4136,
+    'munyaroo md3': 137.40211667,
+    'munyaroo md4': 137.45598333,
+    'munyaroo md5': 137.47265,
+    'munyaroo md6': 137.46836667,
+    'munyaroo md7': 137.41771667,
+    'munyaroo md8': 137.34875,
+    'penneshaw breakwater': 137.94413995,
+    'port macdonnell jetty': 140.70264129,
+    'cable bay': 136.89943,
+    'henley beach jetty 300 m offshore': 138.48489,
+    'henley beach jetty 500 m offshore': 138.4807,
+    'henley beach jetty surf zone': 138.492928,
+    'henley beach jetty 1 nm offshore': 138.470558,
+    'marino 1': 138.50813,
+    'marino 2': 138.50806,
+    'marino 3': 138.5084,
+    'port lincoln salmon pty ltd': 136.18889,
+    'robe breakwater': 139.75290614,
+    'cape jaffa jetty': 139.68792754,
+    'seacliff 1': 138.51652,
+    'seacliff 2': 138.51577,
+    'seacliff 3': 138.5163,
+    'henley beach 1': 138.49114,
+    'henley beach 2': 138.49057,
+    'henley beach 3': 138.49134,
+    'parham 1': 138.25647,
+    'parham 2': 138.25613,
+    'parham 3': 138.25672,
+    'port noarlunga 1': 138.468806,
+    'port noarlunga 2': 138.468712,
+    'port noarlunga 3': 138.468877,
+    'west beach 1': 138.49839,
+    'west beach 2': 138.49832,
+    'west beach 3': 138.49881,
+    'port river 1': 138.4957,
+    'port river 2': 138.49604,
+    'port river 3': 138.49577,
+    'stansbury ad hoc': 137.84987,
+    'aldinga fishkill 3': 138.4475,
+    'aldinga fishkill 1': 138.44753,
+    'aldinga fishkill 2': 138.44772,
+    'largs fishkill 1': 138.48588,
+    'largs fishkill 2': 138.48513,
+    'largs fishkill 3': 138.48562,
+    'robe long beach boatswains point': 139.752,
+    'robe long beach middle': 139.803,
+    'robe long beach south town end': 139.781,
+    'pt. clinton 1': 138.01483,
+    'pt. clinton 2': 138.01613,
+    'pt. clinton 3': 138.01423,
+    'coorong (cor-4a)': 138.9896,
+    'coorong (cor-12a)': 139.3127,
+    'moana 1 fish kill': 138.47021,
+    'moana 2 fish kill': 138.47031,
+    'moana 3 fish kill': 138.47011,
+    'north brighton 1 fish kill': 138.51614,
+    'north brighton 2 fish kill': 138.51615,
+    'north brighton 3 fish kill': 138.51624,
+    'coorong (cor-2a)': 138.91596365,
+    'vivonne bay': 137.18470155,
+    'coorong (cor-1m)': 138.88048059,
+    'port clinton fishkill 1': 138.0281,
+    'port clinton fishkill 2': 138.029,
+    'port clinton fishkill 3': 138.0296,
+    'christies beach fishkill 1': 138.4703,
+    'christies beach fishkill 2': 138.47,
+    'christies beach fishkill 3': 138.4692,
+    'tailem bend fishkill 2': 139.4539,
+    'tailem bend fishkill 3': 139.4546,
+    'coorong (cor-2m)': 138.9317,
+    'coorong (cor-14a)': 139.386535,
+    'henley beach jetty': 138.49085,
+    'washpool rd fishkill 1': 139.43367,
+    'washpool rd fishkill 2': 139.43071,
+    'washpool rd fishkill 3': 139.42803,
+    'hab 01 surface': 137.47,
+    'hab 02 surface': 137.3139994,
+    'hab 03 surface': 137.1575665,
+    'hab 04 surface': 137.0007,
+    'hab 05 surface': 136.843399,
+    'hab 06 surface': 136.6856621,
+    'hab 07 surface': 136.5274884,
+    'hab 08 surface': 136.3688767,
+    'hab 09 surface': 137.4113664,
+    'hab 10 surface': 137.3525063,
+    'hab 11 surface': 137.2934185,
+    'hab 12 surface': 137.2341016,
+    'hab 13 surface': 137.1745545,
+    'hab 14 surface': 137.1147757,
+    'hab 15 surface': 137.054764,
+    'hab 16 surface': 138.0,
+    'hab 17 surface': 138.056,
+    'hab 18 surface': 137.9900956,
+    'hab 19 surface': 137.9239361,
+    'hab 20 surface': 137.8575199,
+    'hab 21 surface': 137.7908458,
+    'hab 22 surface': 137.7239122,
+    'hab 23 surface': 138.2,
+    'hab 24 surface': 138.1566392,
+    'hab 25 surface': 138.1131059,
+    'hab 26 surface': 138.069399,
+    'hab 27 surface': 138.0255174,
+    'hab 28 surface': 137.9814602,
+    'hab 29 surface': 138.35,
+    'hab 30 surface': 138.3208017,
+    'hab 31 surface': 138.2914858,
+    'hab 32 surface': 138.2620515,
+    'hab 33 surface': 138.2324982,
+    'hab 34 surface': 138.1511298,
+    'hab 35 surface': 138.3691161,
+    'hab 36 surface': 138.586953,
+    'hab 37 surface': 138.8046388,
+    'coobowie (cw-3)': 137.73861666,
+    'coobowie (cw-4)': 137.73581667,
+    'coobowie (cw-6)': 137.7346833,
+    'coobowie (cw-6a)': 137.74279997,
+    'stansbury (st-3)': 137.80805,
+    'stansbury (st-4)': 137.80216668,
+    'stansbury (st-8)': 137.83265,
+    'stansbury (st-9)': 137.82598333,
+    'port vincent (pv-2)': 137.8741,
+    'port vincent (pv-4)': 137.88643333,
+    'port vincent (pv-3)': 137.8691,
+    'carrickalinga 1': 138.3207028,
+    'carrickalinga 2': 138.3202113,
+    'carrickalinga 3': 138.319559,
+    'coorong (cor-10a)': 139.2457,
+    'goolwa recreational beach (1)': 138.83008,
+    'goolwa recreational beach (2)': 138.79291,
+    'goolwa recreational beach (3)': 138.74363,
+    'coorong (cor-13a)': 139.3536,
+    'serenity campsite s1': 136.83785,
+    'serenity campsite s3': 136.83785,
+    'serenity campsite s5': 136.83785,
+    'serenity campsite s2': 136.83785,
+    'serenity campsite s4': 136.83785,
+    'serenity campsite s6': 136.83785,
+    'hallet cove fishkill 1': 138.49429,
+    'hallet cove fishkill 2': 138.49394,
+    'hallet cove fishkill 3': 138.49541,
+    'seacliff fishkill 1': 138.51649,
+    'seacliff fishkill 2': 138.51654,
+    'seacliff fishkill 3': 138.51647,
+    'henley beach fishkill 1': 138.49609,
+    'henley beach fishkill 2': 138.49616,
+    'henley beach fishkill 3': 138.49595,
+    'glenelg fishkill 1': 138.51105,
+    'glenelg fishkill 2': 138.50977,
+    'glenelg fishkill 3': 138.50992,
+    'hab 01 bottom': 137.47,
+    'hab 02 bottom': 137.3139994,
+    'hab 03 bottom': 137.1575665,
+    'hab 04 bottom': 137.0007,
+    'hab 05 bottom': 136.843399,
+    'hab 06 bottom': 136.6856621,
+    'hab 07 bottom': 136.5274884,
+    'hab 08 bottom': 136.3688767,
+    'hab 09 bottom': 137.4113664,
+    'hab 10 bottom': 137.3525063,
+    'hab 11 bottom': 137.2934185,
+    'hab 12 bottom': 137.2341016,
+    'hab 13 bottom': 137.1745545,
+    'hab 14 bottom': 137.1147757,
+    'hab 15 bottom': 137.054764,
+    'hab 16 bottom': 138.0,
+    'hab 17 bottom': 138.056,
+    'hab 18 bottom': 137.9900956,
+    'hab 19 bottom': 137.9239361,
+    'hab 20 bottom': 137.8575199,
+    'hab 21 bottom': 137.7908458,
+    'hab 22 bottom': 137.7239122,
+    'hab 23 bottom': 138.2,
+    'hab 24 bottom': 138.1566392,
+    'hab 25 bottom': 138.1131059,
+    'hab 26 bottom': 138.069399,
+    'hab 27 bottom': 138.0255174,
+    'hab 28 bottom': 137.9814602,
+    'hab 29 bottom': 138.35,
+    'hab 30 bottom': 138.3208017,
+    'hab 31 bottom': 138.2914858,
+    'hab 32 bottom': 138.2620515,
+    'hab 33 bottom': 138.2324982,
+    'hab 34 bottom': 138.1511298,
+    'hab 35 bottom': 138.3691161,
+    'hab 36 bottom': 138.586953,
+    'hab 37 bottom': 138.8046388,
+    'klein point fishkill 1': 137.77402,
+    'klein point fishkill 2': 137.77397,
+    'klein point fishkill 3': 137.77452,
+    'port clinton fishkill 1 (oct)': 138.02551,
+    'port clinton fishkill 2 (oct)': 138.02434,
+    'port clinton fishkill 3 (oct)': 138.02244,
+    'ardrossan fishkill 1': 137.91636,
+    'ardrossan fishkill 2': 137.91784,
+    'ardrossan fishkill 3': 137.9175,
+    'second valley fishkill 1': 138.21771667,
+    'second valley fishkill 2': 138.21675,
+    'second valley fishkill 3': 138.21843333,
+    'port noarlunga fishkill 1': 138.46763333,
+    'port noarlunga fishkill 2': 138.46706667,
+    'port noarlunga fishkill 3': 138.46818,
+    'myponga beach fishkill 1': 138.38235,
+    'myponga beach fishkill 2': 138.3819,
+    'myponga beach fishkill 3': 138.38331667,
+    'morgans beach fishkill 1': 138.10574,
+    'morgans beach fishkill 2': 138.10654,
+    'morgans beach fishkill 3': 138.10526,
+    'fishery beach fishkill 1': 138.11476,
+    'fishery beach fishkill 2': 138.11357,
+    'fishery beach fishkill 3': 138.11511,
+    'moana fishkill 1': 138.47029,
+    'moana fishkill 2': 138.47007,
+    'moana fishkill 3': 138.47016,
+    'marion bay fishkill 1 (nov)': 136.97951667,
+    'marion bay fishkill 2 (nov)': 136.98041085,
+    'marion bay fishkill 3 (nov)': 136.97861973,
+    'aldinga beach fishkill 1 (nov)': 138.442544,
+    'aldinga beach fishkill 2 (nov)': 138.442146,
+    'aldinga beach fishkill 3 (nov)': 138.44287,
+    'henley beach fishkill 1 (nov)': 138.49615,
+    'henley beach fishkill 2 (nov)': 138.49591667,
+    'henley beach fishkill 3 (nov)': 138.49575,
+    'christies beach fishkill 1 (nov)': 138.46885,
+    'christies beach fishkill 2 (nov)': 138.46813,
+    'christies beach fishkill 3 (nov)': 138.469,
+    'fishery beach fishkill 1 (nov)': 138.11456,
+    'fishery beach fishkill 2 (nov)': 138.11366,
+    'fishery beach fishkill 3 (nov)': 138.11414,
+    'hallett cove fishkill 1 (nov)': 138.49575,
+    'hallett cove fishkill 2 (nov)': 138.49578,
+    'hallett cove fishkill 3 (nov)': 138.49553,
+    'marino fishkill 1 (nov)': 138.5074,
+    'marino fishkill 2 (nov)': 138.50763,
+    'marino fishkill 3 (nov)': 138.5073,
+    'somerton fishkill 1 (nov)': 138.50963,
+    'somerton fishkill 2 (nov)': 138.50958,
+    'somerton fishkill 3 (nov)': 138.50973,
+    'semaphore fishkill 1 (nov)': 138.47674,
+    'semaphore fishkill 2 (nov)': 138.4768,
+    'semaphore fishkill 3 (nov)': 138.47645,
+    'coorong (cor-6a)': 139.0823,
+    'point lowly lighthouse': 137.78432869,
+    'victor fishkill 1 (nov)': 138.64964,
+    'victor fishkill 2 (nov)': 138.64864,
+    'victor fishkill 3 (nov)': 138.65104,
+    'sultana point fishkill 1 (nov)': 137.75886667,
+    'sultana point fishkill 3 (nov)': 137.75796835,
+    'foul bay fishkill 1 (nov)': 137.20350394,
+    'foul bay fishkill 2 (nov)': 137.20291667,
+    'foul bay fishkill 3 (nov)': 137.20235388,
+    'moorowie fishkill 1 (nov)': 137.53782314,
+    'moorowie fishkill 2 (nov)': 137.53676667,
+    'moorowie fishkill 3 (nov)': 137.53517087,
+    'whyalla beached stingray 1 (nov)': 137.57561667,
+    'whyalla beached stingray 2 (nov)': 137.57446667,
+    'whyalla beached stingray 3 (nov)': 137.57678333,
+    'snapper point fishkill 1 (nov)': 138.51508333,
+    'snapper point fishkill 2 (nov)': 138.51508333,
+    'snapper point fishkill 3 (nov)': 138.51503333,
+    'whyalla wh-a bottom': 137.46897,
+    'whyalla wh-b bottom': 137.54828,
+    'whyalla wh-c bottom': 137.62698,
+    'whyalla wh-d bottom': 137.696,
+    'whyalla wh-e bottom': 137.74773,
+    'aldinga fishkill (nov)': 138.443957,
+    'sellicks beach fishkill (nov)': 138.44757,
+    'silver sands fishkill (nov)': 138.44749,
+    'american river (ar-3)': 137.78605556,
+    'american river (ar-2)': 137.78119444,
+    'american river (ar-1)': 137.77433333,
+    'webb beach fishkill 1 (nov)': 138.2615501,
+    'webb beach fishkill 2 (nov)': 138.261105,
+    'webb beach fishkill 3 (nov)': 138.2605322,
+    'tennyson fishkill 1 (nov)': 138.48303,
+    'tennyson fishkill 2 (nov)': 138.48338,
+    'tennyson fishkill 3 (nov)': 138.4826,
+    'tiddy widdy fishkill 1 (nov)': 137.94096878,
+    'tiddy widdy fishkill 2 (nov)': 137.94035,
+    'tiddy widdy fishkill 3 (nov)': 137.939843,
+    'middleton point': 138.707468,
+    'parsons beach': 138.47202,
+    'waitpinga beach': 138.496202,
+    'christies beach fishkill 1 (nov ii)': 138.46938,
+    'christies beach fishkill 2 (nov ii)': 138.4695,
+    'christies beach fishkill 3 (nov ii)': 138.46864,
+    'semaphore fishkill (nov)': 138.47769,
+    'tennyson fishkill (nov)': 138.4831,
+    'grange fishkill (nov)': 138.4895,
+    'henley beach fishkill (nov)': 138.49435,
+    'glenelg fishkill (nov)': 138.50894,
+    'kingston park (nov)': 138.51243,
+    'somerton park beach (nov)': 138.51006,
+    'seaford fishkill 1 (dec)': 138.4672,
+    'seaford fishkill 2 (dec)': 138.46706,
+    'seaford fishkill 3 (dec)': 138.46678,
+    'port willunga fishkill 1 (dec)': 138.46113,
+    'port willunga fishkill 2 (dec)': 138.46121,
+    'port willunga fishkill 3 (dec)': 138.46134,
+    'brown bay (dec)': 140.833194,
+    'tennyson fishkill 1 (dec)': 138.4849,
+    'tennyson fishkill 2 (dec)': 138.48428,
+    'tennyson fishkill 3 (dec)': 138.48489,
+    'normanville fishkill 1 (dec)': 138.30763,
+    'normanville fishkill 2 (dec)': 138.30841,
+    'normanville fishkill 3 (dec)': 138.3071,
+    'silver sands fishkill 1 (dec)': 138.44768,
+    'silver sands fishkill 2 (dec)': 138.44763,
+    'silver sands fishkill 3 (dec)': 138.44745,
+    'hab 38 bottom': 136.845,
+    'hab 38 surface': 136.845,
+    'hab 39 bottom': 136.6561,
+    'hab 39 surface': 136.6561,
+    'hab 40 bottom': 136.4676,
+    'hab 40 surface': 136.4676,
+    'hab 41 bottom': 136.2797,
+    'hab 41 surface': 136.2797,
+    'hab 42 bottom': 136.0918,
+    'hab 42 surface': 136.0918,
+    'carrickalinga fishkill 1 (dec)': 138.3206582,
+    'carrickalinga fishkill 2 (dec)': 138.32062,
+    'carrickalinga fishkill 3 (dec)': 138.31984,
+    'normanville fishkill 1 (dec ii)': 138.30779,
+    'normanville fishkill 2 (dec ii)': 138.30737,
+    'normanville fishkill 3 (dec ii)': 138.30695,
+    'stony point': 137.752294,
+    'browns beach': 136.89305,
+    'little emu beach': 136.944268,
+    'shell beach': 136.87219,
+    'chinamans': 136.918405,
+    'west bay': 136.831875,
+    'west cape': 136.828189,
+    'deep pondalowie bay': 136.371233,
+    'susanne shoal': 136.5713,
+    'pondalowie out front surface': 136.8104833,
+    'pondalowie mooring surface': 136.83555,
+    'smiths bay beach': 137.445,
+    'stokes bay boat ramp': 137.2037,
+    'moana - seaford beach': 138.465,
+    'moana beach': 138.467778,
+    'sellicks silver sands beach': 138.443333,
+    'sellicks beach': 138.443333,
+    'browns surface': 136.86028,
+    'browns bottom': 136.86028,
+    'inner maquarie bottom': 136.69035,
+    'inner maquarie surface': 136.69035,
+    'lawrey bottom': 136.75525,
+    'lawrey surface': 136.75525,
+    'outer maquarie bottom': 136.622983,
+    'outer maquarie surface': 136.622983,
+    'pondalowie 1 bottom': 136.830783,
+    'pondalowie 1 surface': 136.830783,
+    'pondalowie beach': 136.838466,
+    'pondalowie mooring bottom': 136.83555,
+    'pondalowie out front bottom': 136.8104833,
+    'waller bottom': 136.7954,
+    'waller surface': 136.7954,
+    'north of thistle surface': 136.18636,
+    'north of thistle bottom': 136.18636,
+    'wedge island north': 136.45107,
+    'wedge island bay bottom': 136.46518,
+    'west of wedge island surface': 136.42204,
+    'west of wedge island bottom': 136.42204,
+    'hab 43 bottom': 136.68395,
+    'hab 43 surface': 136.68395,
+    'hab 46 bottom': 136.99416667,
+    'hab 46 surface': 136.99416667,
+    'hab 47 bottom': 136.5384,
+    'hab 47 surface': 136.5384,
+    'emmes bottom': 136.8169,
+    'emmes surface': 136.8169,
+    'neels bottom': 136.3847,
+    'neels surface': 136.3847,
+    'althorpe bottom': 136.8662666,
+    'althorpe surface': 136.8662666,
+    'outer suzzane bottom': 136.5797,
+    'outer suzzane surface': 136.5797,
+    'cape wiles bottom': 135.67819,
+    'cape wiles surface': 135.67819,
+    'williams island bottom': 135.96927,
+    'williams island surface': 135.96927,
+    'maclaren point bottom': 136.02853,
+    'maclaren point surface': 136.02853,
+    'boston aquawatch bottom': 135.90019,
+    'boston aquawatch surface': 135.90019,
+    'west cape offshore surface': 136.89325,
+    'west cape offshore bottom': 136.89325,
+    'daly head surface': 136.91185,
+    'daly head bottom': 136.91185,
+    'lake macquarie bank surface': 136.641653,
+    'lake macquarie bank bottom': 136.641653,
+    'hab 44 bottom': 136.5197667,
+    'hab 44 surface': 136.5197667,
+    'hab 45 bottom': 136.7488,
+    'hab 45 surface': 136.7488,
+    'site 1 (jan)': 136.90991167,
+    'site 2 (jan)': 136.90991167,
+    'site 3 (jan)': 136.90991167,
+    'corny point': 137.0106183,
+    'point souttar fishkill 2 (jan)': 137.30196333,
+    'point souttar fishkill 1 (jan)': 137.30305833,
+    'point souttar fishkill 3 (jan)': 137.30086833,
+    'hab 48 bottom': 135.900507,
+    'hab 48 surface': 135.900507,
+    'hab 49 bottom': 135.997888,
+    'hab 49 surface': 135.997888,
+    'hab 50 bottom': 136.043852,
+    'hab 50 surface': 136.043852,
+    'hab 51 bottom': 136.059845,
+    'hab 51 surface': 136.059845,
+    'hab 52 bottom': 136.06174,
+    'hab 52 surface': 136.06174,
+    'hab 53 bottom': 136.320689,
+    'hab 53 surface': 136.320689,
+    'hab 55 bottom': 136.9338,
+    'hab 55 surface': 136.9338,
+    'neptune 50 bottom': 136.10416,
+    'neptune 50 surface': 136.10416,
+    'neptune north bottom': 136.113633,
+    'neptune north surface': 136.113633,
+    'neptune bay bottom': 136.12218,
+    'neptune bay surface': 136.12218,
+    'corny point dairy rd': 137.08429224,
+    'hab 54 bottom': 136.26332,
+    'hab 54 surface': 136.26332,
+    'thistle ad hoc 1 bottom': 136.14011,
+    'thistle ad hoc 1 surface': 136.14011,
+    'thistle ad hoc 2 bottom': 136.18312,
+    'thistle ad hoc 2 surface': 136.18312,
+    'thistle ad hoc 3 bottom': 136.1965,
+    'thistle ad hoc 3 surface': 136.1965,
+    'thistle ad hoc 4 bottom': 136.1611,
+    'thistle ad hoc 4 surface': 136.1611,
+    'spilsby ad hoc 1 bottom': 136.43011,
+    'spilsby ad hoc 1 surface': 136.43011,
+    'spilsby ad hoc 2 bottom': 136.43184,
+    'spilsby ad hoc 2 surface': 136.43184,
+    'north neptune': 136.074167,
+    'low rocks': 136.033333,
+    'tiperra lighthouse': 137.3999999,
+    'curta rocks bottom': 135.8485,
+    'curta rocks surface': 135.8485,
+    'fishery bay bottom': 135.713698,
+    'fishery bay surface': 135.713698,
+    'red banks bottom': 135.589962,
+    'red banks surface': 135.589962,
+    'almonta bottom': 135.354419,
+    'almonta surface': 135.354419,
+    'hummock bottom': 135.12901,
+    'hummock surface': 135.12901,
+    'reef point bottom': 135.093737,
+    'reef point surface': 135.093737,
+    'coffin bay 1 bottom': 135.236353,
+    'coffin bay 1 surface': 135.236353,
+    'coffin bay 2 bottom': 135.360026,
+    'coffin bay 2 surface': 135.360026,
+    'drummond bottom': 135.22947,
+    'drummond surface': 135.22947,
+    'point turton 1 bottom': 137.2673,
+    'point turton 1 surface': 137.2673,
+    'point turton 2 bottom': 137.3247,
+    'point turton 2 surface': 137.3247,
+    'dany beach': 137.062757,
+    'louth bay jetty': 135.934066,
+    'north shields jetty': 135.867466,
+    'port lincoln town jetty': 135.859721,
+    'point turton 3 bottom': 137.390093,
+    'point turton 3 surface': 137.390093,
+    'caso bottom': 136.574483,
+    'caso surface': 136.574483,
+    'west end bottom': 136.503167,
+    'west end surface': 136.503167,
+    'port rickaby': 137.492863,
+    'hardwicke bay': 137.45537422,
+    'kingston jetty': 139.846222,
+    'kirton point jetty': 135.886522,
+    'shoal bay tunakill 1 (feb 2026)': 137.574869,
+    'point turton fishkill 2 (feb 2026)': 137.35215,
+    'point turton fishkill 3 (feb 2026)': 137.35215,
+    'point turton fishkill 1 (feb 2026)': 137.35215,
+    'hardwicke bay fishkill 2 (feb 2026)': 137.45186667,
+    'hardwicke bay fishkill 3 (feb 2026)': 137.45186667,
+    'hardwicke bay fishkill 1 (feb 2026)': 137.45186667,
+    'kingston park fishkill 1 (feb 2026)': 138.51469444,
+    'kingston park fishkill 2 (feb 2026)': 138.51530556,
+    'kingston park fishkill 3 (feb 2026)': 138.51555556,
+    'long beach robe fishkill 1 (feb 2026)': 139.7625,
+    'long beach robe fishkill 3 (feb 2026)': 139.7625,
+    'long beach robe fishkill 2 (feb 2026)': 139.7625,
+    'port victoria fishkill 2 (feb 2026)': 137.48158333,
+    'port victoria fishkill 3 (feb 2026)': 137.48158333,
+    'port victoria fishkill 1 (feb 2026)': 137.48158333,
+    'port rickaby fishkill 2 (feb 2026)': 137.49441667,
+    'port rickaby fishkill 3 (feb 2026)': 137.49441667,
+    'port rickaby fishkill 1 (feb 2026)': 137.49441667,
+    'wardang island bottom': 137.352,
+    'wardang island surface': 137.352,
+    'wardang island 2 surface': 137.40960016,
+    'wardang island 2 bottom': 137.40960016,
+    'rocky island surface': 134.71825,
+    'williams island 2 surface': 135.91393173,
+    'cape catastrophe surface': 135.99728304,
+    'geltwood beach': 140.17621887,
+    'southend jetty': 140.11373501,
+    'posties beach': 140.649937,
+    'seven mile road coorong robs point fishkill 1 (feb 2026)': 139.31786955,
+    'seven mile road coorong robs point fishkill 2 (feb 2026)': 139.30766548,
+    'seven mile road coorong robs point fishkill 3 (feb 2026)': 139.28561469,
+    'river torrens fishkill 1 (feb 2026)': 138.62718911,
+    'river torrens fishkill 2 (feb 2026)': 138.6263626,
+    'river torrens fishkill 3 (feb 2026)': 138.62260949,
+    'wauraltee beach fishkill 1 (feb 2026)': 137.50274436,
+    'wauraltee beach fishkill 2 (feb 2026)': 137.50200102,
+    'wauraltee beach fishkill 3 (feb 2026)': 137.50001011,
+    'b1 deep chlorophyll max 39m': 137.79000001,
+    'c1 deep chlorophyll max 13m': 137.26,
+    'd1 deep chlorophyll max 12m': 136.80700001,
+    'ad7 deep chlorophyll max 15m': 139.02209952,
+    'e1 surface': 136.53999777,
+    'e3 surface': 136.38700364,
+    'c1 surface': 137.26,
+    'c3 surface': 137.105,
+    'seal bay': 137.31709,
+    'moonta jetty': 137.556818,
+    'destrees bay': 137.59795003,
+    'hanson bay': 136.85376998,
+    'flour cask bay': 137.69093,
+    'encounter boat ramp': 138.598499,
+    'petrel cove beach': 138.599673,
+    'waitpinga beach carpark': 138.499162,
+    'parsons headland': 138.474781,
+    'west bay (ki)': 136.55084552,
+    'brown beach': 140.847492,
+    'weeroona island': 138.0236839,
+    'balgowan': 137.4871,
+    'hab 56 bottom': 136.574,
+    'hab 56 surface': 136.574,
+    'hab 57 bottom': 136.903,
+    'hab 57 surface': 136.903,
+    'proper bay (pb-5)': 135.887567,
+    'bickers island (bi-4)': 135.95625,
+    'boston bay (bb-14)': 135.9444,
+    'lower eyre (bb-15)': 135.88255,
+    'c1 bottom': 137.26,
+    'd1 surface': 136.80700001,
+    'd1 bottom': 136.80700001,
+    'e1 bottom': 136.53999777,
+    'locks well beach': 135.0248198,
+    'wedge island bay surface': 136.46518,
+    'minlacowie': 137.4557,
+    'wallaroo 1b fishkill (mar 2026)': 137.62619,
+    'wallaroo 2a fishkill (mar 2026)': 137.62287,
+    'wallaroo 3a fishkill (mar 2026)': 137.620716,
+    'barker knoll': 138.900375,
+    'mundoo boat ramp': 138.882,
+    'port hughes jetty': 137.54049145,
+    'balgowan 2 bottom': 137.361833,
+    'balgowan 2 surface': 137.361833,
+    'wallaroo bottom': 137.483167,
+    'wallaroo surface': 137.483167,
+    'moonta bottom': 137.4293,
+    'moonta surface': 137.4293,
+    'edithburgh jetty': 137.748764,
+    'bickers island (bi-1a)': 135.90146667,
+    'kellidie bay west (kel-9)': 135.4584,
+    'proper bay (pb-10a)': 135.83836667,
+    'western cove (wk-3)': 137.66916667,
+    'western cove (wk-5)': 137.62421667,
+    'western cove (wk-6)': 137.64211667,
+    'black point 1': 137.8964421,
+    'black point 2': 137.8971975,
+    'black point 3': 137.8955298,
+    'emu bay beach 1 (nov)': 137.533517,
+    'emu bay beach 2 (nov)': 137.536333,
+    'emu bay beach 3 (nov)': 137.5387,
+    'tumby bay 1 fishkill (jul 2025)': 136.11705,
+    'tumby bay 2 fishkill (jul 2025)': 136.118166667,
+    'tumby bay 3 fishkill (jul 2025)': 136.119083333,
+    'bluff beach 2 fishkill (jul 2025)': 137.4805059,
+    'bluff beach 3 fishkill (jul 2025)': 137.480727,
+    'west lakes 1 fishkill (oct 2025)': 138.49078,
+    'west lakes 2 fishkill (oct 2025)': 138.490996,
+    'west lakes 3 fishkill (oct 2025)': 138.4906335,
+    'christies beach 1 fishkill (oct 2025)': 138.468617,
+    'christies beach 2 fishkill (oct 2025)': 138.4683,
+    'christies beach 3 fishkill (oct 2025)': 138.46855,
+    'west lakes shore 1 fishkill (oct 2025)': 138.4775956,
+    'west lakes shore 2 fishkill (oct 2025)': 138.4777854,
+    'west lakes shore 3 fishkill (oct 2025)': 138.4775293,
+    'browns beach 1 fishkill (dec 2025)': 137.85365,
+    'browns beach 2 fishkill (dec 2025)': 137.852633,
+    'browns beach 3 fishkill (dec 2025)': 137.851333,
+    'glenelg 1 fishkill (dec 2025)': 138.50893,
+    'west beach 2 fishkill (dec 2025)': 138.50831,
+    'west beach 3 fishkill (dec 2025)': 138.50563,
+    'west lakes 1 fishkill (nov 2025)': 138.477835,
+    'west lakes 2 fishkill (nov 2025)': 138.477743771,
+    'west lakes 3 fishkill (nov 2025)': 138.47796098,
+    'boatswain point fishkill (mar 2025)': 139.744328305,
+    "hickey's point fishkill (apr 2025)": 137.76482026,
+    'coobowie inlet fishkill (apr 2025)': 137.727481205,
+    'coobowie bay fishkill (apr 2025)': 137.744079785,
+    'point moorowie fishkill (apr 2025)': 137.520707208,
+    'port vincent fishkill (apr 2025)': 137.860039827,
+    'stansbury fishkill (apr 2025)': 137.801122657,
+    'goolwa beach fishkill (apr 2025)': 138.779514233,
+    'edithburgh jetty fishkill (apr 2025)': 137.750533079,
+    'edithburgh windmill fishkill (apr 2025)': 137.74653203,
+    'coobowie fishkill (apr 2025)': 137.741053652,
+    'ki bale 1 fishkill (apr 2025)': 137.353411613,
+    'ki bale 2 fishkill (apr 2025)': 137.3545014,
+    'ki bale 3 fishkill (apr 2025)': 137.3523013,
+    'goolwa beach 2km from mouth fishkill (apr 2025)': 138.861261439,
+    'robe west beach fishkill (apr 2025)': 139.742071768,
+    'kingston fishkill (apr 2025)': 139.843534802,
+    'butlers beach fishkill (apr 2025)': 137.117000135,
+    'innes national park fishkill (apr 2025)': 136.834122589,
+    'marion bay fishkill (apr 2025)': 136.982495698,
+    'goolwa 1 fishkill (apr 2025)': 138.765110385,
+    'goolwa 2 fishkill (apr 2025)': 138.7662142,
+    'goolwa 3 fishkill (apr 2025)': 138.767342,
+    'goolwa 4 fishkill (apr 2025)': 138.76842,
+    'goolwa 5 fishkill (apr 2025)': 138.7695238,
+    'inside cape jaffa fishkill (may 2025)': 139.706892364,
+    'ki emu bay (middle bay) fishkill (may 2025)': 137.530623401,
+    'ki emu bay jetty fishkill (may 2025)': 137.506769404,
+    'ki emu bay vehicle entrance fishkill (may 2025)': 137.508289824,
+    'min oil beach 1 fishkill (may 2025)': 137.669835653,
+    'min oil beach 3 fishkill (may 2025)': 137.668743437,
+    'min oil beach 2 fishkill (may 2025)': 137.670857,
+    'louth bay fishkill (may 2025)': 135.936097368,
+    'port vincent marina fishkill (may 2025)': 137.864365212,
+    'edithburgh jetty fishkill (may 2025)': 137.750533079,
+    'port broughton boat ramp fishkill (may 2025)': 137.92712487,
+    'germein fishkill (may 2025)': 137.994559831,
+    'germein bay fishkill (may 2025)': 137.99911326,
+    'port broughton fishkill (may 2025)': 137.929225392,
+    'goolwa beach site 1 fishkill (jun 2025)': 138.765110385,
+    'goolwa beach site 2 fishkill (jun 2025)': 138.7662142,
+    'nepean bay 1 fishkill (jun 2025)': 137.593666415,
+    'nepean bay 2 fishkill (jun 2025)': 137.5946664,
+    'nepean bay 3 fishkill (jun 2025)': 137.592664,
+    'tennyson beach fishkill (jun 2025)': 138.481646105,
+    'ardrossan jetty 1 fishkill (jul 2025)': 137.929299977,
+    'ardrossan jetty 3 fishkill (jul 2025)': 137.929300022,
+    'ardrossan jetty 2 fishkill (jul 2025)': 137.929300022,
+    'louth bay 1 fishkill (feb 2026)': 135.936097368,
+    'louth bay 2 fishkill (feb 2026)': 135.936097332,
+    'louth bay 3 fishkill (feb 2026)': 135.9360973,
+    'south beach fishkill (mar 2025)': 138.323338777,
+    'south beach lagoon fishkill (mar 2025)': 138.311264,
+    'south creek fishkill (mar 2025)': 138.310899236,
+    'beach hut fishkill (apr 2025)': 137.799121057,
+    'klein hut fishkill (apr 2025)': 137.801170418,
+    'main site fishkill (may 2025)': 138.496277915,
+    'n 50m fishkill (may 2025)': 138.496274185,
+    'fishermans point (may 2025)': 137.934824374,
+    'hallys beach streaky bay fishkill 1 (apr 2026)': 134.09147,
+    'hallys beach streaky bay fishkill 2 (apr 2026)': 134.09147,
+    'hallys beach streaky bay fishkill 3 (apr 2026)': 134.09147,
+    'almonta beach': 135.333133333,
+    'moonlight east fishkill (apr 2026)': 136.0083785,
+    'moonlight centre fishkill (apr 2026)': 136.0038818,
+    'moonlight west fishkill (apr 2026)': 136.0011379,
+    'emu bay fishkill (apr 2026)': 137.512297,
+    'barker reserve 1 fishkill (may 2026)': 138.61211,
+    'barker reserve 2 fishkill (may 2026)': 138.61309,
+    'barker reserve 3 fishkill (may 2026)': 138.6112,
+    'marion bay 1 fishkill (may 2026)': 136.983333,
+    'marion bay 2 fishkill (may 2026)': 136.982719,
+    'marion bay 3 fishkill (may 2026)': 136.9823812,
+    'town jetty fishkill (may 2026)': 135.8588095,
+    'main beach 1 fishkill (may 2026)': 135.8632529,
+    'main beach 2 fishkill (may 2026)': 135.8647184,
+    'point boston 1 bottom': 135.9499,
+    'point boston 1 surface': 135.9499,
+    'point boston 2 bottom': 135.8986,
+    'point boston 2 surface': 135.8986,
+    'point boston 3 bottom': 135.989436,
+    'point boston 3 surface': 135.989436,
+    'north shields 1 fishkill (may 2026)': 135.868529,
+    'north shields 2 fishkill (may 2026)': 135.868529,
+    'north access 3 fishkill (may 2026)': 135.8817,
+    'north access 4 fishkill (may 2026)': 135.8817,
+    'north access 5 fishkill (may 2026)': 135.88044,
+    'north access 6 fishkill (may 2026)': 135.88044,
+    'boston bay mooring bottom': 135.903381,
+    'boston bay mooring surface': 135.903381,
+    'farm beach - fishwatch 1': 135.3946,
+    'farm beach - fishwatch 2': 135.3948,
+    'farm beach - fishwatch 3': 135.3943,
+    'port lincoln marina bridge': 135.8749493,
+    'port lincoln marina boat ramp': 135.8738101,
+    'peak bay 6 fishkill (june 2026)': 136.030444444,
+    'peak bay 1 fishkill (june 2026)': 136.077722222,
+    'peak bay 2 fishkill (june 2026)': 136.078694444,
+    'peak bay 3 fishkill (june 2026)': 136.070833333,
+    'peak bay 4 fishkill (june 2026)': 136.081555556,
+    'peak bay 5 fishkill (june 2026)': 136.025111111,
+    'port neill jetty': 136.351133,
+    'tumby bay surface': 136.1704,
+    'tumby bay bottom': 136.1704,
+    'lipson cove bottom': 136.332,
+    'lipson cove surface': 136.332,
+    'glenelg 1 fishkill (jul 2026)': 138.510279999697,
+    'glenelg 2 fishkill (jul 2026)': 138.509939999938,
+    'glenelg 3 fishkill (jul 2026)': 138.510350000017,
+    'grange 1 fishkill (jul 2026)': 138.491039999723,
+    'grange 2 fishkill (jul 2026)': 138.490740000147,
+    'grange 3 fishkill (jul 2026)': 138.490560000222,
+    'tunkalilla beach': 138.314943000353,
+    'cape willoughby north': 138.129315999612,
+    'cape willoughby south': 138.124859000245,
+    'cape jervis jetty': 138.093308999657,
+    'stansbury jetty': 137.79965098,
+    'wool bay jetty': 137.7597462,
+    'coobowie causeway': 137.7277886,
+    'elliston jetty': 134.8783,
+}